@@ -3,12 +3,43 @@ XLSX (Excel) formatter for PHI documents
 Creates spreadsheets with patient data and de-identified templates
 """
 from openpyxl import Workbook
-from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
+from openpyxl.styles import Font, PatternFill, Alignment, Border, Side, NamedStyle
 from openpyxl.utils import get_column_letter
-from datetime import datetime
+from datetime import date
 import os
 
 
+def _today_mdy():
+    """Return today's date as MM/DD/YYYY; called once per workbook"""
+    return date.today().strftime('%m/%d/%Y')
+
+
+def _named_style(wb, name, **attrs):
+    """Register a named style on the workbook and return its name
+
+    Cells that share a named style are assigned by name, so openpyxl
+    dedupes one style per name instead of one per attribute bundle.
+    """
+    wb.add_named_style(NamedStyle(name=name, **attrs))
+    return name
+
+
+def _thin_border():
+    """Return the thin cell border used by the 'lab_header', 'bordered' and 'flag' styles"""
+    side = Side(style='thin')
+    return Border(left=side, right=side, top=side, bottom=side)
+
+
+def _header_fill():
+    """Return the dark slate fill used by the 'lab_header' and 'header' styles"""
+    return PatternFill(start_color="34495e", end_color="34495e", fill_type="solid")
+
+
+def _section_fill():
+    """Return the light blue fill used by the 'section' style"""
+    return PatternFill(start_color="e8f4f8", end_color="e8f4f8", fill_type="solid")
+
+
 class XLSXFormatter:
     """Creates Excel spreadsheets with PHI content"""
 
@@ -23,14 +54,17 @@ class XLSXFormatter:
         ws.title = "Lab Results"
 
         # Header styling
-        header_fill = PatternFill(start_color="34495e", end_color="34495e", fill_type="solid")
-        header_font = Font(color="FFFFFF", bold=True, size=12)
-        border = Border(
-            left=Side(style='thin'),
-            right=Side(style='thin'),
-            top=Side(style='thin'),
-            bottom=Side(style='thin')
+        header_style = _named_style(
+            wb, 'lab_header',
+            font=Font(color="FFFFFF", bold=True, size=12),
+            fill=_header_fill(),
+            border=_thin_border(),
+            alignment=Alignment(horizontal='center'),
         )
+        section_style = _named_style(wb, 'section', font=Font(bold=True, size=11), fill=_section_fill())
+        label_style = _named_style(wb, 'label', font=Font(bold=True))
+        bordered_style = _named_style(wb, 'bordered', border=_thin_border())
+        flag_style = _named_style(wb, 'flag', font=Font(color="FF0000", bold=True), border=_thin_border())
 
         # Facility header
         ws['A1'] = facility['name'].upper()
@@ -51,9 +85,8 @@ class XLSXFormatter:
         # Patient Information
         row = 6
         ws[f'A{row}'] = "PATIENT INFORMATION"
-        ws[f'A{row}'].font = Font(bold=True, size=11)
+        ws[f'A{row}'].style = section_style
         ws.merge_cells(f'A{row}:B{row}')
-        ws[f'A{row}'].fill = PatternFill(start_color="e8f4f8", end_color="e8f4f8", fill_type="solid")
 
         patient_info = [
             ("Patient Name:", f"{patient['last_name']}, {patient['first_name']}"),
@@ -67,27 +100,26 @@ class XLSXFormatter:
         row += 1
         for label, value in patient_info:
             ws[f'A{row}'] = label
-            ws[f'A{row}'].font = Font(bold=True)
+            ws[f'A{row}'].style = label_style
             ws[f'B{row}'] = value
             row += 1
 
         # Test Information
         row += 1
         ws[f'A{row}'] = "TEST INFORMATION"
-        ws[f'A{row}'].font = Font(bold=True, size=11)
+        ws[f'A{row}'].style = section_style
         ws.merge_cells(f'A{row}:B{row}')
-        ws[f'A{row}'].fill = PatternFill(start_color="e8f4f8", end_color="e8f4f8", fill_type="solid")
 
         test_info = [
             ("Collection Date:", lab_data['test_date'].strftime('%m/%d/%Y')),
-            ("Report Date:", datetime.now().strftime('%m/%d/%Y')),
+            ("Report Date:", _today_mdy()),
             ("Ordering Provider:", f"{provider['first_name']} {provider['last_name']}, {provider['title']}")
         ]
 
         row += 1
         for label, value in test_info:
             ws[f'A{row}'] = label
-            ws[f'A{row}'].font = Font(bold=True)
+            ws[f'A{row}'].style = label_style
             ws[f'B{row}'] = value
             row += 1
 
@@ -102,10 +134,7 @@ class XLSXFormatter:
         for col, header in enumerate(headers, 1):
             cell = ws.cell(row=row, column=col)
             cell.value = header
-            cell.font = header_font
-            cell.fill = header_fill
-            cell.border = border
-            cell.alignment = Alignment(horizontal='center')
+            cell.style = header_style
 
         # Results data
         for result in lab_data['results']:
@@ -114,15 +143,14 @@ class XLSXFormatter:
             ws.cell(row=row, column=2, value=result['value'])
             ws.cell(row=row, column=3, value=result['unit'])
             ws.cell(row=row, column=4, value=result['reference_range'])
-            flag_cell = ws.cell(row=row, column=5, value=result.get('flag', ''))
-
-            # Highlight abnormal results
-            if result.get('flag'):
-                flag_cell.font = Font(color="FF0000", bold=True)
+            ws.cell(row=row, column=5, value=result.get('flag', ''))
 
             # Apply borders
-            for col in range(1, 6):
-                ws.cell(row=row, column=col).border = border
+            for col in range(1, 5):
+                ws.cell(row=row, column=col).style = bordered_style
+
+            # Highlight abnormal results
+            ws.cell(row=row, column=5).style = flag_style if result.get('flag') else bordered_style
 
         # Adjust column widths
         ws.column_dimensions['A'].width = 30
@@ -154,22 +182,24 @@ class XLSXFormatter:
         ws.merge_cells('A1:D1')
         ws['A1'].alignment = Alignment(horizontal='center')
 
-        ws['A2'] = f"Report Date: {datetime.now().strftime('%m/%d/%Y')}"
+        ws['A2'] = f"Report Date: {_today_mdy()}"
         ws.merge_cells('A2:D2')
         ws['A2'].alignment = Alignment(horizontal='center')
 
         # Column headers
         row = 4
         headers = ['Age Group', 'Count', 'Percentage', 'Primary Diagnosis Categories']
-        header_fill = PatternFill(start_color="34495e", end_color="34495e", fill_type="solid")
-        header_font = Font(color="FFFFFF", bold=True)
+        header_style = _named_style(
+            wb, 'header',
+            font=Font(color="FFFFFF", bold=True),
+            fill=_header_fill(),
+            alignment=Alignment(horizontal='center'),
+        )
 
         for col, header in enumerate(headers, 1):
             cell = ws.cell(row=row, column=col)
             cell.value = header
-            cell.font = header_font
-            cell.fill = header_fill
-            cell.alignment = Alignment(horizontal='center')
+            cell.style = header_style
 
         # Aggregate data (no individual patient identifiers)
         age_groups = [
@@ -224,15 +254,17 @@ class XLSXFormatter:
         # Column headers
         row = 4
         headers = ['Service Category', 'Procedure Count', 'Average Charge', 'Total Charges', 'Payment Rate']
-        header_fill = PatternFill(start_color="34495e", end_color="34495e", fill_type="solid")
-        header_font = Font(color="FFFFFF", bold=True)
+        header_style = _named_style(
+            wb, 'header',
+            font=Font(color="FFFFFF", bold=True),
+            fill=_header_fill(),
+            alignment=Alignment(horizontal='center'),
+        )
 
         for col, header in enumerate(headers, 1):
             cell = ws.cell(row=row, column=col)
             cell.value = header
-            cell.font = header_font
-            cell.fill = header_fill
-            cell.alignment = Alignment(horizontal='center')
+            cell.style = header_style
 
         # Generic billing data (no patient identifiers)
         billing_data = [
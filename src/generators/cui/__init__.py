@@ -29,17 +29,24 @@ Available Categories:
     - tax: Federal taxpayer info, written determinations
 """
 
-from .base import BaseCUIGenerator
+from .base import BaseCUIGenerator, dumps_document
 from .factory import CUIGeneratorFactory, CompositeCUIGenerator
 
-# Import all generators to trigger registration
-from .critical_infrastructure_generator import CriticalInfrastructureCUIGenerator
-from .financial_generator import FinancialCUIGenerator
-from .law_enforcement_generator import LawEnforcementCUIGenerator
-from .legal_generator import LegalCUIGenerator
-from .procurement_generator import ProcurementCUIGenerator
-from .proprietary_generator import ProprietaryCUIGenerator
-from .tax_generator import TaxCUIGenerator
+# Category generators are imported on first use (see
+# CUIGeneratorFactory._lazy_registry), so loading the package does not pull
+# in every generator module. Class names follow the category names, e.g.
+# 'law_enforcement' -> 'LawEnforcementCUIGenerator'.
+_GENERATOR_CATEGORIES = {
+    ''.join(word.capitalize() for word in category.split('_')) + 'CUIGenerator': category
+    for category in CUIGeneratorFactory._lazy_registry
+}
+
+
+def __getattr__(name):
+    if name in _GENERATOR_CATEGORIES:
+        return CUIGeneratorFactory.get_generator_class(_GENERATOR_CATEGORIES[name])
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     'BaseCUIGenerator',
@@ -52,4 +59,5 @@ __all__ = [
     'ProcurementCUIGenerator',
     'ProprietaryCUIGenerator',
     'TaxCUIGenerator',
+    'dumps_document',
 ]
@@ -4,13 +4,87 @@ Base CUI generator abstract class.
 All CUI category generators inherit from this class.
 """
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from functools import lru_cache
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional, Sequence, Tuple, Type
 from faker import Faker
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
+import math
 import random
 import json
 import os
 
+# Bound once at import; each call then skips the module attribute lookup.
+# These share the module-level RNG, so random.seed() still applies.
+_choice = random.choice
+_rand = random.random
+_randrange = random.randrange
+
+# Shards submitted ahead of the consumer per worker process in iter_batch;
+# enough to keep every worker busy without queueing the whole batch
+_SHARDS_IN_FLIGHT_PER_WORKER = 2
+
+# English month names for format_date, which avoids strftime's
+# format-string parsing on the per-document path
+_MONTHS = (
+    'January', 'February', 'March', 'April', 'May', 'June',
+    'July', 'August', 'September', 'October', 'November', 'December',
+)
+
+# Zero-padded day/month numbers ('01'..'31'), indexed by value - 1, so the
+# date formatters look them up instead of running an int format per call
+_PADDED = tuple(f"{n:02d}" for n in range(1, 32))
+
+
+@lru_cache(maxsize=8)
+def _get_faker(locale: str) -> Faker:
+    """
+    Return the shared Faker instance for a locale.
+
+    Building a Faker loads every provider for the locale, which dominates
+    generator construction. Instances are shared per process and are not
+    thread-safe; parallel generation uses processes (see generate_batch).
+    """
+    return Faker(locale)
+
+
+def dumps_document(doc: Dict[str, Any]) -> bytes:
+    """Serialize a generated document to compact UTF-8 JSON bytes."""
+    return json.dumps(doc, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+
+@lru_cache(maxsize=65536)
+def _format_ordinal(ordinal: int, fmt: str) -> str:
+    """strftime for a proleptic Gregorian ordinal; corpus dates repeat, so results are cached."""
+    return date.fromordinal(ordinal).strftime(fmt)
+
+
+def _init_worker(locale: str) -> None:
+    """Process-pool initializer: build the worker's shared Faker before any shard runs."""
+    _get_faker(locale)
+
+
+def _generate_shard(
+    generator_class: Type['BaseCUIGenerator'],
+    locale: str,
+    seed: Optional[int],
+    positive_count: int,
+    negative_count: int,
+    as_bytes: bool = False,
+) -> Tuple[List[Any], List[Any]]:
+    """Worker for BaseCUIGenerator.generate_batch; runs in a child process."""
+    generator = generator_class(locale=locale, seed=seed)
+    # One clock reading for the whole shard instead of one per date drawn
+    generator._batch_now = datetime.now()
+    positives = [generator.generate_positive() for _ in range(positive_count)]
+    negatives = [generator.generate_negative() for _ in range(negative_count)]
+    if as_bytes:
+        # Encoded in the worker: bytes pickle back to the parent faster
+        # than nested dicts and can be written out without re-encoding
+        return [dumps_document(d) for d in positives], [dumps_document(d) for d in negatives]
+    return positives, negatives
+
 
 class BaseCUIGenerator(ABC):
     """
@@ -21,11 +95,22 @@ class BaseCUIGenerator(ABC):
     using Faker - no real CUI data should ever be stored or used.
     """
 
+    # Instance attributes set in __init__. Subclasses that declare their own
+    # __slots__ get a dict-free instance; the rest keep a __dict__ as before.
+    __slots__ = (
+        'fake', 'locale', '_rng', '_batch_now', '_faker_pools',
+        '_authorities', '_markings', '_agencies', '_document_types', '_field_definitions',
+        '_authority_pools', '_distribution_statements',
+    )
+
     # Class-level attributes to be overridden by subclasses
     CATEGORY: str = ""
-    SUBCATEGORIES: List[str] = []
-    CUI_MARKINGS: List[str] = []
-    AUTHORITIES: List[str] = []
+    SUBCATEGORIES: Sequence[str] = ()
+    CUI_MARKINGS: Sequence[str] = ()
+    AUTHORITIES: Sequence[str] = ()
+
+    # Number of values drawn into each lazily built Faker pool
+    FAKER_POOL_SIZE: int = 1024
 
     # Path to reference data files
     DATA_DIR = os.path.join(os.path.dirname(__file__), '..', '..', 'templates', 'cui', 'data')
@@ -38,12 +123,29 @@ class BaseCUIGenerator(ABC):
             locale: Faker locale for generating synthetic data
             seed: Random seed for reproducibility
         """
-        self.fake = Faker(locale)
+        # Shared per locale. Seeding goes through Faker.seed(), which sets the
+        # RNG common to all unseeded Faker instances, so sharing one instance
+        # does not change what a seeded generator produces.
+        self.fake = _get_faker(locale)
         self.locale = locale
         if seed is not None:
             Faker.seed(seed)
             random.seed(seed)
 
+        # Per-instance RNG for the category-specific draws. The category is
+        # mixed into the seed so generators sharing a seed (as a composite
+        # does) do not walk identical streams. The shared base helpers
+        # (reference-data lookups, fiscal years, amounts) still draw
+        # from the module-level RNG seeded above.
+        self._rng = random.Random(f"{seed}:{self.CATEGORY}" if seed is not None else None)
+
+        # Snapshot of "now" shared by every document in a batch; when unset,
+        # the clock is read per call
+        self._batch_now: Optional[datetime] = None
+
+        # Faker value pools, filled slot by slot by _faker_pooled()
+        self._faker_pools: Dict[str, List[Any]] = {}
+
         # Load reference data
         self._authorities = self._load_json('authorities.json')
         self._markings = self._load_json('markings.json')
@@ -51,6 +153,12 @@ class BaseCUIGenerator(ABC):
         self._document_types = self._load_json('document_types.json')
         self._field_definitions = self._load_json('field_definitions.json')
 
+        # Candidate pools behind the base document fields. They depend only on
+        # the reference data and the subcategory, so they are resolved once
+        # rather than on every _build_base_document() call.
+        self._authority_pools: Dict[Optional[str], Sequence[str]] = {}
+        self._distribution_statements = tuple(self._markings.get('distribution_statements', {}).values())
+
     def _load_json(self, filename: str) -> Dict:
         """Load a JSON reference data file."""
         filepath = os.path.join(self.DATA_DIR, filename)
@@ -109,6 +217,182 @@ class BaseCUIGenerator(ABC):
         else:
             return self.generate_negative()
 
+    @classmethod
+    def generate_batch(
+        cls,
+        positive_count: int,
+        negative_count: int = 0,
+        workers: Optional[int] = None,
+        seed: Optional[int] = None,
+        locale: str = 'en_US',
+        as_bytes: bool = False,
+        shard_size: int = 256
+    ) -> List[Any]:
+        """
+        Generate many documents in parallel worker processes.
+
+        Document generation is CPU-bound pure Python, so the work is cut
+        into shards of at most shard_size documents that are spread over
+        the worker processes, each shard with its own generator instance
+        built inside the worker (Faker instances are not shipped between
+        processes). Per-shard seeds are derived from ``seed``, so a seeded
+        batch is reproducible whatever the worker count; an unseeded batch
+        still gives every shard a fresh seed.
+
+        Args:
+            positive_count: Number of CUI-positive documents
+            negative_count: Number of CUI-negative documents
+            workers: Number of worker processes (defaults to the CPU count);
+                    with a single worker the batch runs in-process
+            seed: Random seed for reproducibility
+            locale: Faker locale for synthetic data generation
+            as_bytes: Return each document as JSON bytes (see dumps_document)
+                     instead of a dict
+            shard_size: Maximum number of documents per shard
+
+        Returns:
+            List of generated documents, positives first, then negatives
+        """
+        return list(cls.iter_batch(positive_count, negative_count, workers, seed, locale, as_bytes, shard_size))
+
+    @classmethod
+    def iter_batch(
+        cls,
+        positive_count: int,
+        negative_count: int = 0,
+        workers: Optional[int] = None,
+        seed: Optional[int] = None,
+        locale: str = 'en_US',
+        as_bytes: bool = False,
+        shard_size: int = 256
+    ) -> Iterator[Any]:
+        """
+        Stream documents generated in parallel worker processes.
+
+        Like generate_batch, but the work is cut into shards of at most
+        shard_size documents and each shard is yielded as soon as it (and
+        every shard before it) is done, so callers can write documents out
+        while later shards are still being generated. Only a few shards per
+        worker are submitted ahead of the consumer, so a slow consumer does
+        not pile up finished shards in memory.
+
+        Args:
+            positive_count: Number of CUI-positive documents
+            negative_count: Number of CUI-negative documents
+            workers: Number of worker processes (defaults to the CPU count);
+                    with a single worker the batch runs in-process
+            seed: Random seed for reproducibility
+            locale: Faker locale for synthetic data generation
+            as_bytes: Yield each document as JSON bytes instead of a dict
+            shard_size: Maximum number of documents per shard
+
+        Yields:
+            Generated documents, positives first, then negatives
+        """
+        counts = [(min(shard_size, positive_count - i), 0) for i in range(0, positive_count, shard_size)]
+        counts += [(0, min(shard_size, negative_count - i)) for i in range(0, negative_count, shard_size)]
+        if not counts:
+            return
+
+        # Unseeded batches still get per-shard seeds (random.Random(None) is
+        # OS-seeded); otherwise forked workers replay the parent's Faker stream.
+        seed_rng = random.Random(seed)
+        shards = [
+            (cls, locale, seed_rng.getrandbits(64), positives, negatives, as_bytes)
+            for positives, negatives in counts
+        ]
+        workers = max(1, min(workers or os.cpu_count() or 1, len(shards)))
+
+        if workers == 1:
+            for shard in shards:
+                positives, negatives = _generate_shard(*shard)
+                yield from positives
+                yield from negatives
+            return
+
+        # executor.map would submit every shard up front and hold each
+        # finished one until it is consumed; a bounded window of futures
+        # keeps at most _SHARDS_IN_FLIGHT_PER_WORKER shards per worker alive.
+        window = _SHARDS_IN_FLIGHT_PER_WORKER * workers
+        pending: Deque[Future] = deque()
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(locale,)) as executor:
+            for shard in shards:
+                if len(pending) == window:
+                    positives, negatives = pending.popleft().result()
+                    yield from positives
+                    yield from negatives
+                pending.append(executor.submit(_generate_shard, *shard))
+            while pending:
+                positives, negatives = pending.popleft().result()
+                yield from positives
+                yield from negatives
+
+    @classmethod
+    def generate_to_jsonl(
+        cls,
+        path: str,
+        positive_count: int,
+        negative_count: int = 0,
+        workers: Optional[int] = None,
+        seed: Optional[int] = None,
+        locale: str = 'en_US',
+        shard_size: int = 256
+    ) -> int:
+        """
+        Generate documents straight to a newline-delimited JSON file.
+
+        Documents are encoded in the worker processes and written as each
+        shard arrives (see iter_batch), so memory is bounded by the shards
+        in flight rather than by the number of documents requested.
+
+        Args:
+            path: Output file path
+            positive_count: Number of CUI-positive documents
+            negative_count: Number of CUI-negative documents
+            workers: Number of worker processes (defaults to the CPU count)
+            seed: Random seed for reproducibility
+            locale: Faker locale for synthetic data generation
+            shard_size: Maximum number of documents per shard
+
+        Returns:
+            Number of documents written
+        """
+        written = 0
+        with open(path, 'wb', buffering=1 << 20) as f:
+            for line in cls.iter_batch(positive_count, negative_count, workers, seed, locale, True, shard_size):
+                f.write(line)
+                f.write(b'\n')
+                written += 1
+        return written
+
+    def iter_positive(self, n: int) -> Iterator[Dict[str, Any]]:
+        """
+        Yield n CUI-positive documents one at a time.
+
+        Args:
+            n: Number of documents to generate
+
+        Yields:
+            Generated documents
+        """
+        # Share one clock reading across the batch, unless a caller
+        # already set one
+        previous_now = self._batch_now
+        self._batch_now = self.now()
+        try:
+            for _ in range(n):
+                yield self.generate_positive()
+        finally:
+            self._batch_now = previous_now
+
+    def generate_positive_bytes(self) -> bytes:
+        """Generate a CUI-positive document serialized as JSON bytes."""
+        return dumps_document(self.generate_positive())
+
+    def generate_negative_bytes(self) -> bytes:
+        """Generate a CUI-negative document serialized as JSON bytes."""
+        return dumps_document(self.generate_negative())
+
     def get_classification_header(self, subcategory: Optional[str] = None) -> str:
         """
         Get the formatted classification header for this CUI category.
@@ -139,7 +423,7 @@ class BaseCUIGenerator(ABC):
         else:
             markings = category_markings.get('category_specific', [self.get_classification_header()])
 
-        return random.choice(markings) if markings else self.get_classification_header()
+        return _choice(markings) if markings else self.get_classification_header()
 
     def get_authority(self, subcategory: Optional[str] = None) -> str:
         """
@@ -151,24 +435,30 @@ class BaseCUIGenerator(ABC):
         Returns:
             Authority reference string (e.g., CFR/FAR/USC reference)
         """
+        authorities = self._authority_pools.get(subcategory)
+        if authorities is None:
+            authorities = self._authority_pools[subcategory] = self._resolve_authorities(subcategory)
+        return _choice(authorities) if authorities else ""
+
+    def _resolve_authorities(self, subcategory: Optional[str]) -> Sequence[str]:
+        """Resolve the authority references get_authority() draws from."""
         category_authorities = self._authorities.get(self.CATEGORY, {})
         if subcategory and subcategory in category_authorities:
-            authorities = category_authorities[subcategory]
+            return category_authorities[subcategory]
         elif 'general' in category_authorities:
-            authorities = category_authorities['general']
-        else:
-            # Flatten all subcategory authorities
-            authorities = []
-            for subcat_auths in category_authorities.values():
-                if isinstance(subcat_auths, list):
-                    authorities.extend(subcat_auths)
+            return category_authorities['general']
 
-        return random.choice(authorities) if authorities else ""
+        # Flatten all subcategory authorities
+        authorities = []
+        for subcat_auths in category_authorities.values():
+            if isinstance(subcat_auths, list):
+                authorities.extend(subcat_auths)
+        return authorities
 
     def get_distribution_statement(self) -> str:
         """Get a distribution statement for the document."""
-        statements = self._markings.get('distribution_statements', {})
-        return random.choice(list(statements.values())) if statements else ""
+        statements = self._distribution_statements
+        return _choice(statements) if statements else ""
 
     def get_confidentiality_notice(self, notice_type: str = 'standard') -> str:
         """
@@ -194,7 +484,7 @@ class BaseCUIGenerator(ABC):
             Agency name string
         """
         agencies = self._agencies.get(agency_type, [])
-        return random.choice(agencies) if agencies else self.fake.company()
+        return _choice(agencies) if agencies else self.fake.company()
 
     def get_agency_title(self, title_type: str = 'executive') -> str:
         """
@@ -207,12 +497,103 @@ class BaseCUIGenerator(ABC):
             Title string
         """
         titles = self._agencies.get('titles', {}).get(title_type, [])
-        return random.choice(titles) if titles else "Director"
+        return _choice(titles) if titles else "Director"
+
+    def generate_hex_id(self, length: int = 8) -> str:
+        """
+        Generate an uppercase hexadecimal identifier.
+
+        Draws the bits straight from the generator's RNG, which is cheaper
+        than slicing a Faker UUID and stays reproducible under a seed.
+
+        Args:
+            length: Number of hex digits to return
+
+        Returns:
+            Hex string of exactly ``length`` characters
+        """
+        return f"{self._rng.getrandbits(4 * length):0{length}X}"
+
+    def _draw_ids(self, n: int, low: int, high: int, template: str = '%d') -> List[str]:
+        """
+        Draw n integers in [low, high] and render each through a %-template.
+
+        Args:
+            n: Number of IDs to draw
+            low: Smallest value (inclusive)
+            high: Largest value (inclusive)
+            template: printf-style template with a single integer field
+
+        Returns:
+            List of formatted ID strings
+        """
+        return [template % value for value in self._draw_ints(n, low, high)]
+
+    def _draw_ints(self, n: int, low: int, high: int) -> List[int]:
+        """Draw n integers in [low, high] (bulk form of random.randint)."""
+        randrange = self._rng.randrange
+        stop = high + 1
+        return [randrange(low, stop) for _ in range(n)]
+
+    def _faker_pooled(self, key: str, factory: Callable[[], Any]) -> Any:
+        """
+        Draw a value from the Faker pool stored under key.
+
+        Faker calls cost hundreds of microseconds each; reusing a pool of
+        FAKER_POOL_SIZE values trades some variety for throughput. Slots are
+        filled on first draw, so short-lived generators never pay for values
+        they do not use.
+
+        Args:
+            key: Pool name
+            factory: Zero-argument callable producing one pool value
+
+        Returns:
+            A pooled value
+        """
+        pool = self._faker_pools.get(key)
+        if pool is None:
+            pool = self._faker_pools[key] = [None] * self.FAKER_POOL_SIZE
+        slot = self._rng.randrange(self.FAKER_POOL_SIZE)
+        value = pool[slot]
+        if value is None:
+            value = pool[slot] = factory()
+        return value
+
+    def pooled_name(self) -> str:
+        """Return a person name drawn from the instance's name pool."""
+        return self._faker_pooled('name', self.fake.name)
+
+    def pooled_names(self, k: int) -> List[str]:
+        """Return k person names drawn from the instance's name pool."""
+        pooled, factory = self._faker_pooled, self.fake.name
+        return [pooled('name', factory) for _ in range(k)]
+
+    def pooled_company(self) -> str:
+        """Return a company name drawn from the instance's company pool."""
+        return self._faker_pooled('company', self.fake.company)
+
+    def pooled_job(self) -> str:
+        """Return a job title drawn from the instance's job pool."""
+        return self._faker_pooled('job', self.fake.job)
+
+    def pooled_address(self) -> Tuple[str, str, str, str]:
+        """Return a (street, city, state_abbr, zipcode) tuple drawn from the address pool."""
+        return self._faker_pooled('address', self._fake_address)
+
+    def _fake_address(self) -> Tuple[str, str, str, str]:
+        """Build one address tuple for the address pool."""
+        fake = self.fake
+        return fake.street_address(), fake.city(), fake.state_abbr(), fake.zipcode()
 
     def generate_document_id(self) -> str:
         """Generate a unique document ID."""
         prefix = self.CATEGORY[:4].upper()
-        return f"{prefix}_{self.fake.uuid4()[:8].upper()}"
+        return f"{prefix}_{self.generate_hex_id(8)}"
+
+    def now(self) -> datetime:
+        """Get the current time, or the batch snapshot when one is active."""
+        return self._batch_now or datetime.now()
 
     def generate_date_in_range(self, start_days: int = -730, end_days: int = 0) -> datetime:
         """
@@ -225,33 +606,101 @@ class BaseCUIGenerator(ABC):
         Returns:
             Random datetime within range
         """
-        start_date = datetime.now() + timedelta(days=start_days)
-        end_date = datetime.now() + timedelta(days=end_days)
+        now = self.now()
+        start_date = now + timedelta(days=start_days)
+        end_date = now + timedelta(days=end_days)
         return self.fake.date_time_between(start_date=start_date, end_date=end_date)
 
+    def generate_day_in_range(self, start_days: int = -730, end_days: int = 0) -> date:
+        """
+        Generate a random calendar day within a range.
+
+        Cheaper than generate_date_in_range for fields that only show the
+        date: it is integer arithmetic on the day ordinal instead of a Faker
+        datetime draw.
+
+        Args:
+            start_days: Days before today (negative) or after (positive)
+            end_days: Days before today (negative) or after (positive)
+
+        Returns:
+            Random date within range (both ends inclusive)
+        """
+        return date.fromordinal(self.now().toordinal() + self._rng.randint(start_days, end_days))
+
     def generate_fiscal_year(self) -> int:
         """Generate a valid fiscal year."""
-        return random.randint(2024, 2030)
+        return _randrange(2024, 2031)
 
     def generate_currency_amount(self, min_amt: int = 1000, max_amt: int = 10000000) -> float:
         """Generate a currency amount."""
-        return round(random.uniform(min_amt, max_amt), 2)
+        return round(min_amt + (max_amt - min_amt) * _rand(), 2)
+
+    def generate_currency_amounts(
+        self,
+        min_amt: int = 1000,
+        max_amt: int = 10000000,
+        k: int = 1,
+        log_uniform: bool = False
+    ) -> List[float]:
+        """
+        Generate k currency amounts in one call (bulk form of generate_currency_amount).
+
+        Args:
+            min_amt: Smallest amount
+            max_amt: Largest amount
+            k: Number of amounts to generate
+            log_uniform: Draw uniformly in log space, so each order of
+                        magnitude is equally likely, as with real budgets
+
+        Returns:
+            List of amounts rounded to cents
+        """
+        if log_uniform:
+            log_min = math.log(min_amt)
+            log_span = math.log(max_amt) - log_min
+            return [round(math.exp(log_min + log_span * _rand()), 2) for _ in range(k)]
+        span = max_amt - min_amt
+        return [round(min_amt + span * _rand(), 2) for _ in range(k)]
 
     def format_currency(self, amount: float) -> str:
         """Format a currency amount."""
         return f"${amount:,.2f}"
 
-    def _build_base_document(self, doc_type: str, subcategory: str, is_positive: bool) -> Dict[str, Any]:
+    def format_currency_cents(self, cents: int) -> str:
+        """Format a non-negative integer amount of cents (same output as format_currency)."""
+        dollars, cents = divmod(cents, 100)
+        return f"${dollars:,}.{cents:02d}"
+
+    def format_date(self, value: date) -> str:
+        """Format a date as 'Month DD, YYYY' (same output as strftime('%B %d, %Y'))."""
+        return f"{_MONTHS[value.month - 1]} {_PADDED[value.day - 1]}, {value.year}"
+
+    def format_date_numeric(self, value: date) -> str:
+        """Format a date as 'MM/DD/YYYY' (same output as strftime('%m/%d/%Y'))."""
+        return f"{_PADDED[value.month - 1]}/{_PADDED[value.day - 1]}/{value.year}"
+
+    def _build_base_document(
+        self,
+        doc_type: str,
+        subcategory: str,
+        is_positive: bool,
+        **fields: Any
+    ) -> Dict[str, Any]:
         """
         Build the base document structure common to all CUI documents.
 
+        Document-specific fields are merged in the same dict literal, so the
+        result is sized once instead of being grown by a later update().
+
         Args:
             doc_type: Type of document being generated
             subcategory: Subcategory of CUI
             is_positive: Whether this is a CUI-positive document
+            **fields: Document-specific fields; these override base fields
 
         Returns:
-            Base document dictionary
+            Document dictionary
         """
         return {
             'document_id': self.generate_document_id(),
@@ -263,6 +712,7 @@ class BaseCUIGenerator(ABC):
             'authority': self.get_authority(subcategory) if is_positive else None,
             'distribution': self.get_distribution_statement() if is_positive else None,
             'generated_date': datetime.now().isoformat(),
-            'document_date': self.generate_date_in_range().strftime('%B %d, %Y'),
+            'document_date': self.format_date(self.generate_date_in_range()),
             'agency': self.get_agency(),
+            **fields,
         }
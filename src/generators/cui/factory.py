@@ -4,7 +4,11 @@ CUI Generator Factory with registry pattern.
 Provides a central registry for all CUI category generators and
 factory methods for creating them.
 """
-from typing import Dict, List, Optional, Type, Any
+from typing import Dict, Iterator, List, Optional, Type, Any
+from bisect import bisect
+from datetime import datetime
+from importlib import import_module
+from itertools import accumulate
 import random
 
 from .base import BaseCUIGenerator
@@ -35,6 +39,19 @@ class CUIGeneratorFactory:
 
     _registry: Dict[str, Type[BaseCUIGenerator]] = {}
 
+    # Built-in categories and the modules that define them. A module is only
+    # imported (and its generator registered) the first time its category
+    # is requested.
+    _lazy_registry: Dict[str, str] = {
+        'critical_infrastructure': 'critical_infrastructure_generator',
+        'financial': 'financial_generator',
+        'law_enforcement': 'law_enforcement_generator',
+        'legal': 'legal_generator',
+        'procurement': 'procurement_generator',
+        'proprietary': 'proprietary_generator',
+        'tax': 'tax_generator',
+    }
+
     @classmethod
     def register(cls, category: str):
         """
@@ -62,6 +79,35 @@ class CUIGeneratorFactory:
             return generator_class
         return decorator
 
+    @classmethod
+    def _load(cls, category: str) -> None:
+        """Import the module for a built-in category so it registers itself."""
+        if category not in cls._registry and category in cls._lazy_registry:
+            import_module(f".{cls._lazy_registry[category]}", __package__)
+
+    @classmethod
+    def get_generator_class(cls, category: str) -> Type[BaseCUIGenerator]:
+        """
+        Get the generator class for a CUI category, importing it if needed.
+
+        Args:
+            category: The CUI category name
+
+        Returns:
+            The registered generator class
+
+        Raises:
+            KeyError: If category is not registered
+        """
+        cls._load(category)
+        if category not in cls._registry:
+            available = ', '.join(cls.get_all_categories())
+            raise KeyError(
+                f"Unknown CUI category: '{category}'. "
+                f"Available categories: {available}"
+            )
+        return cls._registry[category]
+
     @classmethod
     def get_generator(
         cls,
@@ -83,23 +129,20 @@ class CUIGeneratorFactory:
         Raises:
             KeyError: If category is not registered
         """
-        if category not in cls._registry:
-            available = ', '.join(cls._registry.keys())
-            raise KeyError(
-                f"Unknown CUI category: '{category}'. "
-                f"Available categories: {available}"
-            )
-        return cls._registry[category](locale=locale, seed=seed)
+        return cls.get_generator_class(category)(locale=locale, seed=seed)
 
     @classmethod
     def get_all_categories(cls) -> List[str]:
         """
         Get a list of all registered CUI categories.
 
+        Built-in categories are listed even if their module has not been
+        imported yet.
+
         Returns:
             List of category names
         """
-        return list(cls._registry.keys())
+        return list(dict.fromkeys([*cls._lazy_registry, *cls._registry]))
 
     @classmethod
     def is_registered(cls, category: str) -> bool:
@@ -112,7 +155,7 @@ class CUIGeneratorFactory:
         Returns:
             True if category is registered, False otherwise
         """
-        return category in cls._registry
+        return category in cls._registry or category in cls._lazy_registry
 
     @classmethod
     def create_composite_generator(
@@ -137,7 +180,7 @@ class CUIGeneratorFactory:
             categories = cls.get_all_categories()
 
         # Validate categories
-        invalid = [c for c in categories if c not in cls._registry]
+        invalid = [c for c in categories if not cls.is_registered(c)]
         if invalid:
             raise KeyError(f"Unknown CUI categories: {invalid}")
 
@@ -157,6 +200,11 @@ class CompositeCUIGenerator:
     several CUI categories while maintaining consistent distribution.
     """
 
+    __slots__ = ('generators', 'categories', '_weights', '_cum_weights', '_total_weight')
+
+    # Number of category picks drawn per random.choices call when batching
+    CATEGORY_CHUNK_SIZE = 1024
+
     def __init__(
         self,
         generators: Dict[str, BaseCUIGenerator],
@@ -184,6 +232,19 @@ class CompositeCUIGenerator:
         if seed is not None:
             random.seed(seed)
 
+    @property
+    def weights(self) -> Dict[str, float]:
+        """Category weights used when no category is requested."""
+        return self._weights
+
+    @weights.setter
+    def weights(self, weights: Dict[str, float]) -> None:
+        # Cumulative weights are cached for _select_category, so assign a new
+        # dict rather than mutating the current one in place
+        self._weights = weights
+        self._cum_weights = list(accumulate(weights[c] for c in self.categories))
+        self._total_weight = self._cum_weights[-1] if self._cum_weights else 0.0
+
     def generate_positive(self, category: Optional[str] = None) -> Dict[str, Any]:
         """
         Generate a CUI-positive document.
@@ -247,23 +308,65 @@ class CompositeCUIGenerator:
         Returns:
             List of generated documents
         """
-        documents = []
+        return list(self.generate_batch_iter(positive_count, negative_count, category))
+
+    def generate_batch_iter(
+        self,
+        positive_count: int,
+        negative_count: int,
+        category: Optional[str] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Generate a batch of documents one at a time.
 
-        for _ in range(positive_count):
-            documents.append(self.generate_positive(category))
+        Yields the same mix as generate_batch, but only one document is held
+        at a time, so large batches can be written out as they are produced.
 
-        for _ in range(negative_count):
-            documents.append(self.generate_negative(category))
+        Args:
+            positive_count: Number of CUI-positive documents
+            negative_count: Number of CUI-negative documents
+            category: Specific category to generate from (optional)
 
-        # Shuffle to mix positive and negative
-        random.shuffle(documents)
-        return documents
+        Yields:
+            Generated documents, positives and negatives mixed at random
+        """
+        remaining_positive = positive_count
+        remaining = positive_count + negative_count
+
+        # Share one clock reading across the batch instead of per document
+        batch_now = datetime.now()
+        previous_now = {}
+        for cat, generator in self.generators.items():
+            previous_now[cat] = generator._batch_now
+            generator._batch_now = batch_now
+        try:
+            while remaining:
+                # Draw categories a chunk at a time in one call each
+                chunk = min(remaining, self.CATEGORY_CHUNK_SIZE)
+                if category is None:
+                    categories = random.choices(self.categories, cum_weights=self._cum_weights, k=chunk)
+                else:
+                    categories = [category] * chunk
+
+                for cat in categories:
+                    generator = self.generators[cat]
+                    # Positive with probability remaining_positive / remaining,
+                    # which gives every positive/negative ordering equal odds
+                    if random.random() * remaining < remaining_positive:
+                        remaining_positive -= 1
+                        document = generator.generate_positive()
+                    else:
+                        document = generator.generate_negative()
+                    remaining -= 1
+                    yield document
+        finally:
+            for cat, generator in self.generators.items():
+                generator._batch_now = previous_now[cat]
 
     def _select_category(self) -> str:
         """Select a category based on weights."""
-        total_weight = sum(self.weights.values())
-        normalized_weights = [self.weights[c] / total_weight for c in self.categories]
-        return random.choices(self.categories, weights=normalized_weights, k=1)[0]
+        index = bisect(self._cum_weights, random.random() * self._total_weight, 0, len(self.categories) - 1)
+        return self.categories[index]
 
     def get_categories(self) -> List[str]:
         """Get list of categories in this composite generator."""
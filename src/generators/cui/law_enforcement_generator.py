@@ -5,11 +5,10 @@ Generates synthetic CUI documents for:
 - Criminal History Records Information
 - Investigation files and reports
 """
-from typing import Any, Dict, List, Optional
-import random
+from typing import Any, Callable, Dict, List, Optional
 from datetime import datetime, timedelta
 
-from .base import BaseCUIGenerator
+from .base import BaseCUIGenerator, _format_ordinal
 from .factory import CUIGeneratorFactory
 
 
@@ -17,23 +16,29 @@ from .factory import CUIGeneratorFactory
 class LawEnforcementCUIGenerator(BaseCUIGenerator):
     """Generator for Law Enforcement CUI documents."""
 
+    __slots__ = (
+        '_doc_types', '_positive_subcategories',
+        '_investigation_dispatch', '_investigation_types',
+        '_negative_dispatch', '_negative_types',
+    )
+
     CATEGORY = 'law_enforcement'
-    SUBCATEGORIES = ['criminal_history', 'investigation', 'general']
-    CUI_MARKINGS = [
+    SUBCATEGORIES = ('criminal_history', 'investigation', 'general')
+    CUI_MARKINGS = (
         'CUI//LES',
         'CUI//SP-CRIM',
         'CUI//SP-INVST',
         'LAW ENFORCEMENT SENSITIVE',
-    ]
-    AUTHORITIES = [
+    )
+    AUTHORITIES = (
         '28 USC 534',
         '5 USC 552(b)(7)',
         'Privacy Act of 1974',
         'Inspector General Act of 1978',
-    ]
+    )
 
     # Criminal history data
-    OFFENSE_TYPES = [
+    OFFENSE_TYPES = (
         'Fraud',
         'Embezzlement',
         'Tax Evasion',
@@ -42,311 +47,367 @@ class LawEnforcementCUIGenerator(BaseCUIGenerator):
         'Wire Fraud',
         'Money Laundering',
         'Bribery',
-    ]
+    )
 
-    INVESTIGATION_STATUS = [
+    INVESTIGATION_STATUS = (
         'Open',
         'Active',
         'Pending Review',
         'Closed',
         'Referred for Prosecution',
         'Administratively Closed',
-    ]
+    )
 
-    INVESTIGATING_AGENCIES = [
+    INVESTIGATING_AGENCIES = (
         'Federal Bureau of Investigation',
         'Securities and Exchange Commission',
         'Department of Health and Human Services OIG',
         'Department of Justice',
         'Internal Revenue Service Criminal Investigation',
         'Office of Inspector General',
-    ]
+    )
+
+    # Criminal history record codes
+    SEXES = ('Male', 'Female')
+    RACE_CODES = ('W', 'B', 'H', 'A', 'O')
+    HAIR_COLORS = ('BLK', 'BRN', 'BLN', 'RED', 'GRY')
+    EYE_COLORS = ('BRN', 'BLU', 'GRN', 'HAZ')
+    DISPOSITIONS = ('Convicted', 'Acquitted', 'Dismissed', 'Pending')
+    SENTENCES = ('Probation', 'Fine', 'Incarceration', 'N/A')
+
+    # Public bulletin details
+    BULLETIN_PUBLISHERS = ('FBI', 'FTC', 'SEC', 'OIG')
+    FRAUD_ALERT_TYPES = (
+        'Healthcare Fraud Alert',
+        'Investment Scam Warning',
+        'Phishing Campaign Alert',
+        'Identity Theft Trends',
+    )
+    PUBLIC_SAFETY_TOPICS = (
+        'Severe Weather Preparedness',
+        'Community Emergency Response',
+        'Cybersecurity Best Practices',
+        'Holiday Safety Tips',
+    )
+
+    # Reasons a criminal history record is requested
+    RECORD_REQUEST_PURPOSES = (
+        'Employment Background Check',
+        'Security Clearance Investigation',
+        'Law Enforcement Inquiry',
+    )
+
+    # Investigation participants and outcomes
+    AGENT_TITLES = ('Special Agent', 'Criminal Investigator', 'Supervisory Agent')
+    SUBJECT_STATUSES = ('Target', 'Subject', 'Witness', 'Person of Interest')
+    INTERVIEWEE_STATUSES = ('Witness', 'Subject', 'Cooperating Individual')
+    NEXT_STEPS = (
+        'Continue investigation',
+        'Prepare referral for prosecution',
+        'Schedule grand jury presentation',
+        'Close investigation administratively',
+    )
+
+    # Interview and evidence details
+    INTERVIEW_SUBJECT_MATTERS = (
+        'financial transactions',
+        'organizational structure',
+        'personnel matters',
+        'business operations',
+    )
+    INTERVIEW_TOPICS = ('transactions', 'meetings', 'communications', 'documents')
+    EVIDENCE_DESCRIPTIONS = (
+        'Financial documents',
+        'Electronic storage device',
+        'Email correspondence',
+        'Bank statements',
+        'Contracts and agreements',
+        'Photographs',
+    )
 
     def __init__(self, locale: str = 'en_US', seed: Optional[int] = None):
         super().__init__(locale, seed)
 
+        # Resolved once; the reference data does not change after load
+        self._doc_types = self._document_types.get(self.CATEGORY, {})
+
+        # Subcategory / document type -> builder, resolved once instead of per document
+        self._positive_subcategories = tuple(self.SUBCATEGORIES[:2])  # Exclude 'general'
+        self._investigation_dispatch: Dict[str, Callable[[str], Dict[str, Any]]] = {
+            'investigation_report': self._generate_investigation_report,
+            'interview_summary': self._generate_interview_summary,
+            'evidence_log': self._generate_evidence_log,
+        }
+        self._investigation_types = tuple(self._investigation_dispatch)
+        self._negative_dispatch: Dict[str, Callable[[], Dict[str, Any]]] = {
+            'crime_prevention': self._generate_crime_prevention,
+            'fraud_awareness': self._generate_fraud_awareness,
+            'public_safety': self._generate_public_safety_bulletin,
+        }
+        self._negative_types = tuple(self._negative_dispatch)
+
     def get_document_types(self) -> List[Dict[str, Any]]:
         """Get available document types for law enforcement category."""
-        return self._document_types.get(self.CATEGORY, {})
+        return self._doc_types
 
     def generate_positive(self) -> Dict[str, Any]:
         """Generate a CUI-positive law enforcement document."""
-        subcategory = random.choice(self.SUBCATEGORIES[:2])  # Exclude 'general'
+        subcategory = self._rng.choice(self._positive_subcategories)
 
         if subcategory == 'criminal_history':
             return self._generate_criminal_history(subcategory)
-        else:
-            doc_type = random.choice(['investigation_report', 'interview_summary', 'evidence_log'])
-            if doc_type == 'investigation_report':
-                return self._generate_investigation_report(subcategory)
-            elif doc_type == 'interview_summary':
-                return self._generate_interview_summary(subcategory)
-            else:
-                return self._generate_evidence_log(subcategory)
+        doc_type = self._rng.choice(self._investigation_types)
+        return self._investigation_dispatch[doc_type](subcategory)
 
     def generate_negative(self) -> Dict[str, Any]:
         """Generate a CUI-negative law enforcement document."""
-        doc_type = random.choice(['crime_prevention', 'fraud_awareness', 'public_safety'])
-
-        if doc_type == 'crime_prevention':
-            return self._generate_crime_prevention()
-        elif doc_type == 'fraud_awareness':
-            return self._generate_fraud_awareness()
-        else:
-            return self._generate_public_safety_bulletin()
+        doc_type = self._rng.choice(self._negative_types)
+        return self._negative_dispatch[doc_type]()
 
     def _generate_criminal_history(self, subcategory: str) -> Dict[str, Any]:
         """Generate a criminal history record."""
         subject_name = self.fake.name()
         dob = self.fake.date_of_birth(minimum_age=25, maximum_age=70)
 
-        doc = self._build_base_document('criminal_history', subcategory, is_positive=True)
-        doc.update({
-            'title': 'Criminal History Record Information',
-            'classification': 'CONTROLLED UNCLASSIFIED INFORMATION - CRIMINAL HISTORY',
-            'record_id': f"CHR-{self.fake.uuid4()[:10].upper()}",
-            'subject': {
+        # One bulk draw per field instead of a choice() per entry
+        choices = self._rng.choices
+        entry_count = self._rng.randint(1, 4)
+        criminal_entries = [
+            {
+                'arrest_date': self.format_date_numeric(self.generate_day_in_range(-3650, -365)),
+                'agency': agency,
+                'charge': charge,
+                'disposition': disposition,
+                'sentence': sentence,
+            }
+            for agency, charge, disposition, sentence in zip(
+                choices(self.INVESTIGATING_AGENCIES, k=entry_count),
+                choices(self.OFFENSE_TYPES, k=entry_count),
+                choices(self.DISPOSITIONS, k=entry_count),
+                choices(self.SENTENCES, k=entry_count),
+            )
+        ]
+
+        record_hex = self.generate_hex_id(9)
+        return self._build_base_document(
+            'criminal_history', subcategory, is_positive=True,
+            title='Criminal History Record Information',
+            classification='CONTROLLED UNCLASSIFIED INFORMATION - CRIMINAL HISTORY',
+            record_id=f"CHR-{record_hex[:8]}-{record_hex[8]}",
+            subject={
                 'name': subject_name,
-                'aliases': [self.fake.name() for _ in range(random.randint(0, 2))],
-                'dob': dob.strftime('%m/%d/%Y'),
-                'ssn_last4': f"XXX-XX-{random.randint(1000, 9999)}",
-                'fbi_number': f"{random.randint(100000, 999999)}AA{random.randint(1, 9)}",
-                'state_id': f"ST{random.randint(1000000, 9999999)}",
+                'aliases': self.pooled_names(self._rng.randint(0, 2)),
+                'dob': self.format_date_numeric(dob),
+                'ssn_last4': f"XXX-XX-{self._rng.randint(1000, 9999)}",
+                'fbi_number': f"{self._rng.randint(100000, 999999)}AA{self._rng.randint(1, 9)}",
+                'state_id': f"ST{self._rng.randint(1000000, 9999999)}",
             },
-            'physical_description': {
-                'sex': random.choice(['Male', 'Female']),
-                'race': random.choice(['W', 'B', 'H', 'A', 'O']),
-                'height': f"{random.randint(5, 6)}'{random.randint(0, 11)}\"",
-                'weight': f"{random.randint(120, 250)} lbs",
-                'hair': random.choice(['BLK', 'BRN', 'BLN', 'RED', 'GRY']),
-                'eyes': random.choice(['BRN', 'BLU', 'GRN', 'HAZ']),
+            physical_description={
+                'sex': self._rng.choice(self.SEXES),
+                'race': self._rng.choice(self.RACE_CODES),
+                'height': f"{self._rng.randint(5, 6)}'{self._rng.randint(0, 11)}\"",
+                'weight': f"{self._rng.randint(120, 250)} lbs",
+                'hair': self._rng.choice(self.HAIR_COLORS),
+                'eyes': self._rng.choice(self.EYE_COLORS),
             },
-            'criminal_entries': [
-                {
-                    'arrest_date': self.generate_date_in_range(-3650, -365).strftime('%m/%d/%Y'),
-                    'agency': random.choice(self.INVESTIGATING_AGENCIES),
-                    'charge': random.choice(self.OFFENSE_TYPES),
-                    'disposition': random.choice(['Convicted', 'Acquitted', 'Dismissed', 'Pending']),
-                    'sentence': random.choice(['Probation', 'Fine', 'Incarceration', 'N/A']),
-                }
-                for _ in range(random.randint(1, 4))
-            ],
-            'record_source': 'Interstate Identification Index (III)',
-            'purpose': random.choice([
-                'Employment Background Check',
-                'Security Clearance Investigation',
-                'Law Enforcement Inquiry',
-            ]),
-            'requesting_agency': random.choice(self.INVESTIGATING_AGENCIES),
-            'request_date': self.generate_date_in_range(-30, 0).strftime('%B %d, %Y'),
-            'confidentiality_notice': (
+            criminal_entries=criminal_entries,
+            record_source='Interstate Identification Index (III)',
+            purpose=self._rng.choice(self.RECORD_REQUEST_PURPOSES),
+            requesting_agency=self._rng.choice(self.INVESTIGATING_AGENCIES),
+            request_date=self.format_date(self.generate_day_in_range(-30, 0)),
+            confidentiality_notice=(
                 "Criminal History Record Information is CUI under 28 USC 534. "
                 "Unauthorized disclosure is prohibited and may result in criminal penalties."
             ),
-        })
-        return doc
+        )
 
     def _generate_investigation_report(self, subcategory: str) -> Dict[str, Any]:
         """Generate an investigation report."""
         subject_name = self.fake.name()
-        agency = random.choice(self.INVESTIGATING_AGENCIES)
-
-        doc = self._build_base_document('investigation_report', subcategory, is_positive=True)
-        doc.update({
-            'title': 'Investigation Report',
-            'classification': 'CONTROLLED UNCLASSIFIED INFORMATION - INVESTIGATION',
-            'case_number': f"{random.randint(2020, 2025)}-INV-{random.randint(100000, 999999)}",
-            'investigating_agency': agency,
-            'case_agent': {
-                'name': self.fake.name(),
-                'badge_number': f"{random.randint(1000, 9999)}",
-                'title': random.choice(['Special Agent', 'Criminal Investigator', 'Supervisory Agent']),
+        agency = self._rng.choice(self.INVESTIGATING_AGENCIES)
+
+        alleged_offense = self._rng.choice(self.OFFENSE_TYPES).lower()
+        period_start = _format_ordinal(self.generate_day_in_range(-730, -365).toordinal(), '%B %Y')
+        period_end = _format_ordinal(self.generate_day_in_range(-365, -30).toordinal(), '%B %Y')
+
+        return self._build_base_document(
+            'investigation_report', subcategory, is_positive=True,
+            title='Investigation Report',
+            classification='CONTROLLED UNCLASSIFIED INFORMATION - INVESTIGATION',
+            case_number=f"{self._rng.randint(2020, 2025)}-INV-{self._rng.randint(100000, 999999)}",
+            investigating_agency=agency,
+            case_agent={
+                'name': self.pooled_name(),
+                'badge_number': f"{self._rng.randint(1000, 9999)}",
+                'title': self._rng.choice(self.AGENT_TITLES),
             },
-            'subject': {
+            subject={
                 'name': subject_name,
-                'status': random.choice(['Target', 'Subject', 'Witness', 'Person of Interest']),
-                'employer': self.fake.company(),
+                'status': self._rng.choice(self.SUBJECT_STATUSES),
+                'employer': self.pooled_company(),
             },
-            'investigation_type': random.choice(self.OFFENSE_TYPES) + ' Investigation',
-            'investigation_status': random.choice(self.INVESTIGATION_STATUS),
-            'date_opened': self.generate_date_in_range(-365, -30).strftime('%B %d, %Y'),
-            'summary': (
-                f"This investigation was initiated based on allegations of {random.choice(self.OFFENSE_TYPES).lower()} "
-                f"involving {subject_name} during the period of "
-                f"{self.generate_date_in_range(-730, -365).strftime('%B %Y')} to "
-                f"{self.generate_date_in_range(-365, -30).strftime('%B %Y')}."
+            investigation_type=self._rng.choice(self.OFFENSE_TYPES) + ' Investigation',
+            investigation_status=self._rng.choice(self.INVESTIGATION_STATUS),
+            date_opened=self.format_date(self.generate_day_in_range(-365, -30)),
+            summary=(
+                f"This investigation was initiated based on allegations of {alleged_offense} "
+                f"involving {subject_name} during the period of {period_start} to {period_end}."
             ),
-            'allegations': [
-                f"Allegation {i+1}: {random.choice(self.OFFENSE_TYPES)}"
-                for i in range(random.randint(1, 4))
+            allegations=[
+                f"Allegation {i}: {offense}"
+                for i, offense in enumerate(self._rng.choices(self.OFFENSE_TYPES, k=self._rng.randint(1, 4)), 1)
             ],
-            'evidence_collected': random.randint(5, 25),
-            'interviews_conducted': random.randint(3, 15),
-            'estimated_loss': self.format_currency(self.generate_currency_amount(10000, 5000000)),
-            'next_steps': random.choice([
-                'Continue investigation',
-                'Prepare referral for prosecution',
-                'Schedule grand jury presentation',
-                'Close investigation administratively',
-            ]),
-            'supervisor_approval': {
-                'name': self.fake.name(),
+            evidence_collected=self._rng.randint(5, 25),
+            interviews_conducted=self._rng.randint(3, 15),
+            estimated_loss=self.format_currency(self.generate_currency_amount(10000, 5000000)),
+            next_steps=self._rng.choice(self.NEXT_STEPS),
+            supervisor_approval={
+                'name': self.pooled_name(),
                 'title': 'Supervisory Special Agent',
-                'date': self.generate_date_in_range(-7, 0).strftime('%B %d, %Y'),
+                'date': self.format_date(self.generate_day_in_range(-7, 0)),
             },
-        })
-        return doc
+        )
 
     def _generate_interview_summary(self, subcategory: str) -> Dict[str, Any]:
         """Generate an investigative interview summary."""
         interviewee = self.fake.name()
+        street, city, state, _ = self.pooled_address()
+        summary_date = self.format_date(self.generate_day_in_range(-30, 0))
+        subject_matter = self._rng.choice(self.INTERVIEW_SUBJECT_MATTERS)
 
-        doc = self._build_base_document('interview_summary', subcategory, is_positive=True)
-        doc.update({
-            'title': 'Investigative Interview Summary',
-            'classification': 'LAW ENFORCEMENT SENSITIVE',
-            'case_number': f"{random.randint(2020, 2025)}-INV-{random.randint(100000, 999999)}",
-            'interview_date': self.generate_date_in_range(-30, 0).strftime('%B %d, %Y'),
-            'interview_location': f"{self.fake.street_address()}, {self.fake.city()}, {self.fake.state_abbr()}",
-            'interviewee': {
+        return self._build_base_document(
+            'interview_summary', subcategory, is_positive=True,
+            title='Investigative Interview Summary',
+            classification='LAW ENFORCEMENT SENSITIVE',
+            case_number=f"{self._rng.randint(2020, 2025)}-INV-{self._rng.randint(100000, 999999)}",
+            interview_date=self.format_date(self.generate_day_in_range(-30, 0)),
+            interview_location=f"{street}, {city}, {state}",
+            interviewee={
                 'name': interviewee,
-                'status': random.choice(['Witness', 'Subject', 'Cooperating Individual']),
-                'employer': self.fake.company(),
-                'title': self.fake.job(),
+                'status': self._rng.choice(self.INTERVIEWEE_STATUSES),
+                'employer': self.pooled_company(),
+                'title': self.pooled_job(),
             },
-            'interviewing_agents': [
-                {'name': self.fake.name(), 'title': 'Special Agent'}
-                for _ in range(random.randint(1, 2))
+            interviewing_agents=[
+                {'name': name, 'title': 'Special Agent'}
+                for name in self.pooled_names(self._rng.randint(1, 2))
             ],
-            'counsel_present': random.choice([True, False]),
-            'recorded': random.choice([True, False]),
-            'duration': f"{random.randint(1, 4)} hours",
-            'summary': (
-                f"On {self.generate_date_in_range(-30, 0).strftime('%B %d, %Y')}, agents interviewed "
+            counsel_present=bool(self._rng.getrandbits(1)),
+            recorded=bool(self._rng.getrandbits(1)),
+            duration=f"{self._rng.randint(1, 4)} hours",
+            summary=(
+                f"On {summary_date}, agents interviewed "
                 f"{interviewee} regarding their knowledge of activities related to the subject matter "
-                f"of this investigation. The interviewee provided information concerning "
-                f"{random.choice(['financial transactions', 'organizational structure', 'personnel matters', 'business operations'])}."
+                f"of this investigation. The interviewee provided information concerning {subject_matter}."
             ),
-            'key_points': [
-                f"Point {i+1}: Information regarding {random.choice(['transactions', 'meetings', 'communications', 'documents'])}"
-                for i in range(random.randint(3, 6))
+            key_points=[
+                f"Point {i}: Information regarding {topic}"
+                for i, topic in enumerate(self._rng.choices(self.INTERVIEW_TOPICS, k=self._rng.randint(3, 6)), 1)
             ],
-            'documents_provided': random.randint(0, 10),
-            'follow_up_required': random.choice([True, False]),
-            'prepared_by': {
-                'name': self.fake.name(),
+            documents_provided=self._rng.randint(0, 10),
+            follow_up_required=bool(self._rng.getrandbits(1)),
+            prepared_by={
+                'name': self.pooled_name(),
                 'title': 'Special Agent',
-                'date': self.generate_date_in_range(-7, 0).strftime('%B %d, %Y'),
+                'date': self.format_date(self.generate_day_in_range(-7, 0)),
             },
-        })
-        return doc
+        )
 
     def _generate_evidence_log(self, subcategory: str) -> Dict[str, Any]:
         """Generate an evidence collection log."""
-        doc = self._build_base_document('evidence_log', subcategory, is_positive=True)
-        doc.update({
-            'title': 'Evidence Collection Log',
-            'classification': 'LAW ENFORCEMENT SENSITIVE',
-            'case_number': f"{random.randint(2020, 2025)}-INV-{random.randint(100000, 999999)}",
-            'collection_date': self.generate_date_in_range(-60, 0).strftime('%B %d, %Y'),
-            'collection_location': f"{self.fake.street_address()}, {self.fake.city()}, {self.fake.state_abbr()}",
-            'collecting_agent': {
-                'name': self.fake.name(),
-                'badge_number': f"{random.randint(1000, 9999)}",
+        street, city, state, _ = self.pooled_address()
+        item_count = self._rng.randint(3, 8)
+
+        return self._build_base_document(
+            'evidence_log', subcategory, is_positive=True,
+            title='Evidence Collection Log',
+            classification='LAW ENFORCEMENT SENSITIVE',
+            case_number=f"{self._rng.randint(2020, 2025)}-INV-{self._rng.randint(100000, 999999)}",
+            collection_date=self.format_date(self.generate_day_in_range(-60, 0)),
+            collection_location=f"{street}, {city}, {state}",
+            collecting_agent={
+                'name': self.pooled_name(),
+                'badge_number': f"{self._rng.randint(1000, 9999)}",
             },
-            'evidence_items': [
+            evidence_items=[
                 {
-                    'item_number': f"EV-{random.randint(1000, 9999)}",
-                    'description': random.choice([
-                        'Financial documents',
-                        'Electronic storage device',
-                        'Email correspondence',
-                        'Bank statements',
-                        'Contracts and agreements',
-                        'Photographs',
-                    ]),
-                    'quantity': random.randint(1, 50),
+                    'item_number': item_number,
+                    'description': description,
+                    'quantity': quantity,
                     'chain_of_custody': 'Maintained',
                 }
-                for _ in range(random.randint(3, 8))
+                for item_number, description, quantity in zip(
+                    self._draw_ids(item_count, 1000, 9999, 'EV-%d'),
+                    self._rng.choices(self.EVIDENCE_DESCRIPTIONS, k=item_count),
+                    self._draw_ints(item_count, 1, 50),
+                )
             ],
-            'storage_location': f"Evidence Vault {random.randint(1, 10)}",
-            'witness_to_collection': self.fake.name(),
-        })
-        return doc
+            storage_location=f"Evidence Vault {self._rng.randint(1, 10)}",
+            witness_to_collection=self.pooled_name(),
+        )
 
     def _generate_crime_prevention(self) -> Dict[str, Any]:
         """Generate crime prevention resources (negative example)."""
-        doc = self._build_base_document('crime_prevention', 'general', is_positive=False)
-        doc.update({
-            'title': 'Crime Prevention Resources',
-            'publisher': 'Federal Bureau of Investigation',
-            'publication_date': self.generate_date_in_range(-180, 0).strftime('%B %d, %Y'),
-            'audience': 'General Public',
-            'topics': [
+        return self._build_base_document(
+            'crime_prevention', 'general', is_positive=False,
+            title='Crime Prevention Resources',
+            publisher='Federal Bureau of Investigation',
+            publication_date=self.format_date(self.generate_day_in_range(-180, 0)),
+            audience='General Public',
+            topics=[
                 'Identity Theft Prevention',
                 'Online Safety Tips',
                 'Reporting Suspicious Activity',
                 'Scam Awareness',
             ],
-            'resources': [
+            resources=[
                 'IC3.gov - Internet Crime Complaint Center',
                 'FBI Tips Portal',
                 'Local Field Office Contact Information',
             ],
-            'distribution': 'Unlimited Public Distribution',        })
-        return doc
+            distribution='Unlimited Public Distribution',
+        )
 
     def _generate_fraud_awareness(self) -> Dict[str, Any]:
         """Generate fraud awareness bulletin (negative example)."""
-        doc = self._build_base_document('fraud_awareness', 'general', is_positive=False)
-        doc.update({
-            'title': 'Fraud Awareness Bulletin',
-            'publisher': random.choice(['FBI', 'FTC', 'SEC', 'OIG']),
-            'bulletin_number': f"FAB-{random.randint(2024, 2025)}-{random.randint(1, 50)}",
-            'publication_date': self.generate_date_in_range(-90, 0).strftime('%B %d, %Y'),
-            'alert_type': random.choice([
-                'Healthcare Fraud Alert',
-                'Investment Scam Warning',
-                'Phishing Campaign Alert',
-                'Identity Theft Trends',
-            ]),
-            'description': (
+        return self._build_base_document(
+            'fraud_awareness', 'general', is_positive=False,
+            title='Fraud Awareness Bulletin',
+            publisher=self._rng.choice(self.BULLETIN_PUBLISHERS),
+            bulletin_number=f"FAB-{self._rng.randint(2024, 2025)}-{self._rng.randint(1, 50)}",
+            publication_date=self.format_date(self.generate_day_in_range(-90, 0)),
+            alert_type=self._rng.choice(self.FRAUD_ALERT_TYPES),
+            description=(
                 "This bulletin provides general awareness information about current fraud trends. "
                 "No law enforcement sensitive information is included."
             ),
-            'red_flags': [
+            red_flags=[
                 'Unsolicited contacts requesting personal information',
                 'Pressure to act immediately',
                 'Requests for unusual payment methods',
                 'Offers that seem too good to be true',
             ],
-            'reporting_instructions': 'Report suspected fraud to local authorities',
-            'distribution': 'Unlimited Public Distribution',        })
-        return doc
+            reporting_instructions='Report suspected fraud to local authorities',
+            distribution='Unlimited Public Distribution',
+        )
 
     def _generate_public_safety_bulletin(self) -> Dict[str, Any]:
         """Generate a public safety bulletin (negative example)."""
-        doc = self._build_base_document('public_safety', 'general', is_positive=False)
-        doc.update({
-            'title': 'Public Safety Bulletin',
-            'publisher': 'Department of Homeland Security',
-            'publication_date': self.generate_date_in_range(-30, 0).strftime('%B %d, %Y'),
-            'topic': random.choice([
-                'Severe Weather Preparedness',
-                'Community Emergency Response',
-                'Cybersecurity Best Practices',
-                'Holiday Safety Tips',
-            ]),
-            'content': (
+        return self._build_base_document(
+            'public_safety', 'general', is_positive=False,
+            title='Public Safety Bulletin',
+            publisher='Department of Homeland Security',
+            publication_date=self.format_date(self.generate_day_in_range(-30, 0)),
+            topic=self._rng.choice(self.PUBLIC_SAFETY_TOPICS),
+            content=(
                 "This public bulletin provides general safety information for community awareness. "
                 "No sensitive law enforcement information is included."
             ),
-            'tips': [
+            tips=[
                 'Develop a family communication plan',
                 'Maintain emergency supplies',
                 'Stay informed through official channels',
                 'Know your evacuation routes',
             ],
-            'distribution': 'Unlimited Public Distribution',        })
-        return doc
+            distribution='Unlimited Public Distribution',
+        )
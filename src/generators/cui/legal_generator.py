@@ -7,11 +7,9 @@ Generates synthetic CUI documents for:
 - Legislative Materials
 - Administrative Proceedings
 """
-from typing import Any, Dict, List, Optional
-import random
-from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional
 
-from .base import BaseCUIGenerator
+from .base import BaseCUIGenerator, _format_ordinal
 from .factory import CUIGeneratorFactory
 
 
@@ -19,23 +17,25 @@ from .factory import CUIGeneratorFactory
 class LegalCUIGenerator(BaseCUIGenerator):
     """Generator for Legal CUI documents."""
 
+    __slots__ = ('_positive_dispatch', '_negative_dispatch', '_negative_types')
+
     CATEGORY = 'legal'
-    SUBCATEGORIES = ['privilege', 'collective_bargaining', 'legislative', 'administrative']
-    CUI_MARKINGS = [
+    SUBCATEGORIES = ('privilege', 'collective_bargaining', 'legislative', 'administrative')
+    CUI_MARKINGS = (
         'CUI//SP-PRVLG',
         'CUI//SP-CLBRG',
         'CUI - LEGAL',
         'ATTORNEY-CLIENT PRIVILEGED',
-    ]
-    AUTHORITIES = [
+    )
+    AUTHORITIES = (
         'Federal Rules of Evidence 501',
         '5 USC Chapter 71',
         '5 USC 552(b)(5)',
         'Administrative Procedure Act',
-    ]
+    )
 
     # Legal matter types
-    LEGAL_MATTERS = [
+    LEGAL_MATTERS = (
         'Employment Dispute',
         'Contract Interpretation',
         'Regulatory Compliance',
@@ -44,336 +44,398 @@ class LegalCUIGenerator(BaseCUIGenerator):
         'Personnel Action',
         'Ethics Advisory',
         'Policy Implementation',
-    ]
+    )
 
     # Bargaining units
-    BARGAINING_UNITS = [
+    BARGAINING_UNITS = (
         'AFGE Local',
         'NTEU Chapter',
         'NFFE Local',
         'SEIU Local',
-    ]
+    )
 
     # Legislative bodies
-    LEGISLATIVE_BODIES = [
+    LEGISLATIVE_BODIES = (
         'House Committee on Oversight',
         'Senate Committee on Finance',
         'House Committee on Appropriations',
         'Senate Committee on Homeland Security',
         'House Ways and Means Committee',
-    ]
+    )
+
+    # Attorney memo details
+    ATTORNEY_TITLES = ('Associate General Counsel', 'Attorney Advisor', 'Deputy General Counsel')
+    RECOMMENDATIONS = (
+        'Proceed with proposed action',
+        'Modify approach as outlined',
+        'Seek additional information',
+        'Delay pending further analysis',
+    )
+
+    # Bargaining proposal details
+    NEGOTIATION_STATUSES = ('Initial Proposal', 'Counter-Proposal', 'Final Offer')
+    BARGAINING_SUBJECTS = (
+        'Telework Policy',
+        'Performance Evaluation',
+        'Leave Policies',
+        'Grievance Procedures',
+        'Work Schedules',
+        'Training and Development',
+    )
+
+    # Congressional testimony details
+    HEARING_TOPICS = (
+        'Agency Budget Request',
+        'Program Oversight',
+        'Policy Implementation',
+        'Regulatory Reform',
+        'Audit Findings',
+    )
+    TESTIMONY_FOCUSES = ('priorities', 'progress', 'challenges', 'achievements')
+    TESTIMONY_AREAS = ('program administration', 'service delivery', 'compliance', 'modernization')
+    CLEARANCE_STATUSES = ('Pending OMB Review', 'Agency Review', 'Final Clearance')
+    KEY_MESSAGES = tuple(f"Key message {i} regarding agency priorities" for i in range(1, 6))
+
+    # Administrative hearing details
+    CASE_TYPES = (
+        'Adverse Personnel Action Appeal',
+        'Retirement Benefits Dispute',
+        'Performance Rating Appeal',
+        'Discrimination Complaint',
+        'Whistleblower Retaliation',
+    )
+    ADJUDICATING_BOARDS = ('MSPB', 'EEOC', 'FLRA', 'OWCP')
+    HEARING_ISSUES = ('Procedural violation', 'Substantive violation', 'Penalty determination')
+    RECORD_STATUSES = ('Open', 'Closed', 'Under Advisement')
 
     def __init__(self, locale: str = 'en_US', seed: Optional[int] = None):
         super().__init__(locale, seed)
 
+        # Subcategory / document type -> builder, resolved once instead of per document
+        self._positive_dispatch: Dict[str, Callable[[str], Dict[str, Any]]] = {
+            'privilege': self._generate_attorney_memo,
+            'collective_bargaining': self._generate_bargaining_proposal,
+            'legislative': self._generate_congressional_testimony,
+            'administrative': self._generate_hearing_record,
+        }
+        self._negative_dispatch: Dict[str, Callable[[], Dict[str, Any]]] = {
+            'legal_faq': self._generate_legal_faq,
+            'union_rights': self._generate_union_rights,
+            'public_testimony': self._generate_public_testimony,
+            'appeal_guide': self._generate_appeal_guide,
+        }
+        self._negative_types = tuple(self._negative_dispatch)
+
     def get_document_types(self) -> List[Dict[str, Any]]:
         """Get available document types for legal category."""
         return self._document_types.get(self.CATEGORY, {})
 
     def generate_positive(self) -> Dict[str, Any]:
         """Generate a CUI-positive legal document."""
-        subcategory = random.choice(self.SUBCATEGORIES)
+        subcategory = self._rng.choice(self.SUBCATEGORIES)
+        return self._positive_dispatch[subcategory](subcategory)
 
-        generators = {
-            'privilege': self._generate_attorney_memo,
-            'collective_bargaining': self._generate_bargaining_proposal,
-            'legislative': self._generate_congressional_testimony,
-            'administrative': self._generate_hearing_record,
-        }
+    def generate_positive_batch(self, n: int) -> List[Dict[str, Any]]:
+        """
+        Generate n CUI-positive legal documents.
+
+        Subcategories are drawn in one call, and every document in the
+        batch shares one clock reading for its dates.
+
+        Args:
+            n: Number of documents to generate
 
-        return generators[subcategory](subcategory)
+        Returns:
+            List of generated documents
+        """
+        subcategories = self._rng.choices(self.SUBCATEGORIES, k=n)
+        dispatch = self._positive_dispatch
+        previous_now = self._batch_now
+        self._batch_now = self.now()
+        try:
+            return [dispatch[subcategory](subcategory) for subcategory in subcategories]
+        finally:
+            self._batch_now = previous_now
 
     def generate_negative(self) -> Dict[str, Any]:
         """Generate a CUI-negative legal document."""
-        doc_type = random.choice(['legal_faq', 'union_rights', 'public_testimony', 'appeal_guide'])
+        doc_type = self._rng.choice(self._negative_types)
+        return self._negative_dispatch[doc_type]()
 
-        generators = {
-            'legal_faq': self._generate_legal_faq,
-            'union_rights': self._generate_union_rights,
-            'public_testimony': self._generate_public_testimony,
-            'appeal_guide': self._generate_appeal_guide,
-        }
+    def _memo_number(self) -> str:
+        """Generate a General Counsel memo number such as 'OGC-2024-517'."""
+        # One draw over every (year, sequence) pair, split with divmod
+        year, seq = divmod(self._rng.randrange(2 * 900), 900)
+        return f"OGC-{2024 + year}-{100 + seq}"
+
+    def _union_local(self) -> str:
+        """Generate a bargaining unit and local number such as 'AFGE Local 312'."""
+        # One draw over every (unit, local number) pair, split with divmod
+        unit, local = divmod(self._rng.randrange(len(self.BARGAINING_UNITS) * 900), 900)
+        return f"{self.BARGAINING_UNITS[unit]} {100 + local}"
+
+    def _proposal_number(self) -> str:
+        """Generate a bargaining proposal number such as 'CBP-2025-42'."""
+        # One draw over every (year, sequence) pair, split with divmod
+        year, seq = divmod(self._rng.randrange(2 * 90), 90)
+        return f"CBP-{2024 + year}-{10 + seq}"
 
-        return generators[doc_type]()
+    def _docket_number(self) -> str:
+        """Generate a hearing docket number such as '2022-4817'."""
+        # One draw over every (year, sequence) pair, split with divmod
+        year, seq = divmod(self._rng.randrange(6 * 9000), 9000)
+        return f"{2020 + year}-{1000 + seq}"
 
     def _generate_attorney_memo(self, subcategory: str) -> Dict[str, Any]:
         """Generate an attorney-client privileged memorandum."""
+        choice = self._rng.choice
         agency = self.get_agency()
-        matter = random.choice(self.LEGAL_MATTERS)
+        matter = choice(self.LEGAL_MATTERS)
         attorney = self.fake.name()
-        client = self.fake.name()
-
-        doc = self._build_base_document('attorney_memo', subcategory, is_positive=True)
-        doc.update({
-            'title': 'Attorney-Client Privileged Memorandum',
-            'classification': 'ATTORNEY-CLIENT PRIVILEGED - CUI',
-            'memo_number': f"OGC-{random.randint(2024, 2025)}-{random.randint(100, 999)}",
-            'attorney': {
+        client = self.pooled_name()
+
+        return self._build_base_document(
+            'attorney_memo', subcategory, is_positive=True,
+            title='Attorney-Client Privileged Memorandum',
+            classification='ATTORNEY-CLIENT PRIVILEGED - CUI',
+            memo_number=self._memo_number(),
+            attorney={
                 'name': attorney,
-                'title': random.choice(['Associate General Counsel', 'Attorney Advisor', 'Deputy General Counsel']),
+                'title': choice(self.ATTORNEY_TITLES),
                 'organization': f'{agency} - Office of General Counsel',
             },
-            'client': {
+            client={
                 'name': client,
                 'title': self.get_agency_title('executive'),
                 'organization': agency,
             },
-            'date': self.generate_date_in_range(-30, 0).strftime('%B %d, %Y'),
-            'subject': f"Legal Analysis: {matter}",
-            'privilege_assertion': [
+            date=self.format_date(self.generate_day_in_range(-30, 0)),
+            subject=f"Legal Analysis: {matter}",
+            privilege_assertion=[
                 'Attorney-Client Privilege',
                 'Attorney Work Product',
             ],
-            'question_presented': (
+            question_presented=(
                 f"You have requested a legal analysis regarding {matter.lower()} "
                 f"as it pertains to {agency}'s obligations under applicable law and regulation."
             ),
-            'brief_answer': (
-                f"Based on our analysis, {agency} {'should' if random.choice([True, False]) else 'may'} "
+            brief_answer=(
+                f"Based on our analysis, {agency} {'should' if self._rng.getrandbits(1) else 'may'} "
                 f"proceed with the proposed course of action, subject to the conditions outlined below."
             ),
-            'analysis': (
+            analysis=(
                 "This memorandum provides confidential legal advice regarding the matter described above. "
                 "The analysis is based on the facts provided and applicable legal authorities."
             ),
-            'recommendation': random.choice([
-                'Proceed with proposed action',
-                'Modify approach as outlined',
-                'Seek additional information',
-                'Delay pending further analysis',
-            ]),
-            'confidentiality_notice': (
+            recommendation=choice(self.RECOMMENDATIONS),
+            confidentiality_notice=(
                 "This memorandum is protected by attorney-client privilege and the work product doctrine. "
                 "Do not disclose without authorization from the Office of General Counsel."
             ),
-        })
-        return doc
+        )
 
     def _generate_bargaining_proposal(self, subcategory: str) -> Dict[str, Any]:
         """Generate a collective bargaining proposal."""
         agency = self.get_agency()
-        union = f"{random.choice(self.BARGAINING_UNITS)} {random.randint(100, 999)}"
-
-        doc = self._build_base_document('bargaining_proposal', subcategory, is_positive=True)
-        doc.update({
-            'title': 'Collective Bargaining Proposal',
-            'classification': 'CONTROLLED UNCLASSIFIED INFORMATION - COLLECTIVE BARGAINING',
-            'proposal_number': f"CBP-{random.randint(2024, 2025)}-{random.randint(10, 99)}",
-            'agency': agency,
-            'union': union,
-            'negotiation_status': random.choice(['Initial Proposal', 'Counter-Proposal', 'Final Offer']),
-            'date_submitted': self.generate_date_in_range(-14, 0).strftime('%B %d, %Y'),
-            'articles_under_negotiation': [
+        _, city, state, _ = self.pooled_address()
+
+        return self._build_base_document(
+            'bargaining_proposal', subcategory, is_positive=True,
+            title='Collective Bargaining Proposal',
+            classification='CONTROLLED UNCLASSIFIED INFORMATION - COLLECTIVE BARGAINING',
+            proposal_number=self._proposal_number(),
+            agency=agency,
+            union=self._union_local(),
+            negotiation_status=self._rng.choice(self.NEGOTIATION_STATUSES),
+            date_submitted=self.format_date(self.generate_day_in_range(-14, 0)),
+            articles_under_negotiation=[
                 {
-                    'article': f"Article {random.randint(1, 30)}",
-                    'subject': random.choice([
-                        'Telework Policy',
-                        'Performance Evaluation',
-                        'Leave Policies',
-                        'Grievance Procedures',
-                        'Work Schedules',
-                        'Training and Development',
-                    ]),
+                    'article': f"Article {self._rng.randint(1, 30)}",
+                    'subject': subject,
                     'management_position': 'See attached language',
                 }
-                for _ in range(random.randint(3, 7))
+                for subject in self._rng.choices(self.BARGAINING_SUBJECTS, k=self._rng.randint(3, 7))
             ],
-            'ground_rules': {
-                'negotiation_location': f"{self.fake.city()}, {self.fake.state_abbr()}",
+            ground_rules={
+                'negotiation_location': f"{city}, {state}",
                 'session_dates': [
-                    self.generate_date_in_range(-7, 7).strftime('%B %d, %Y')
+                    self.format_date(self.generate_day_in_range(-7, 7))
                     for _ in range(3)
                 ],
             },
-            'management_team_lead': {
-                'name': self.fake.name(),
+            management_team_lead={
+                'name': self.pooled_name(),
                 'title': 'Labor Relations Officer',
             },
-            'union_team_lead': {
-                'name': self.fake.name(),
+            union_team_lead={
+                'name': self.pooled_name(),
                 'title': 'Union President',
             },
-            'confidentiality_notice': (
+            confidentiality_notice=(
                 "This proposal is confidential under 5 USC Chapter 71. "
                 "Do not disclose outside of the negotiating teams."
             ),
-        })
-        return doc
+        )
 
     def _generate_congressional_testimony(self, subcategory: str) -> Dict[str, Any]:
         """Generate draft congressional testimony."""
+        choice = self._rng.choice
         agency = self.get_agency()
         official = self.fake.name()
-        committee = random.choice(self.LEGISLATIVE_BODIES)
-
-        doc = self._build_base_document('congressional_testimony', subcategory, is_positive=True)
-        doc.update({
-            'title': 'Draft Congressional Testimony',
-            'classification': 'CONTROLLED UNCLASSIFIED INFORMATION - LEGISLATIVE',
-            'document_status': 'DRAFT - PRE-DECISIONAL',
-            'witness': {
+        committee = choice(self.LEGISLATIVE_BODIES)
+
+        return self._build_base_document(
+            'congressional_testimony', subcategory, is_positive=True,
+            title='Draft Congressional Testimony',
+            classification='CONTROLLED UNCLASSIFIED INFORMATION - LEGISLATIVE',
+            document_status='DRAFT - PRE-DECISIONAL',
+            witness={
                 'name': official,
                 'title': self.get_agency_title('executive'),
                 'agency': agency,
             },
-            'committee': committee,
-            'hearing_topic': random.choice([
-                'Agency Budget Request',
-                'Program Oversight',
-                'Policy Implementation',
-                'Regulatory Reform',
-                'Audit Findings',
-            ]),
-            'scheduled_date': self.generate_date_in_range(7, 30).strftime('%B %d, %Y'),
-            'prepared_statement_summary': (
-                f"This testimony addresses {agency}'s {random.choice(['priorities', 'progress', 'challenges', 'achievements'])} "
-                f"in the area of {random.choice(['program administration', 'service delivery', 'compliance', 'modernization'])}."
+            committee=committee,
+            hearing_topic=choice(self.HEARING_TOPICS),
+            scheduled_date=self.format_date(self.generate_day_in_range(7, 30)),
+            prepared_statement_summary=(
+                f"This testimony addresses {agency}'s {choice(self.TESTIMONY_FOCUSES)} "
+                f"in the area of {choice(self.TESTIMONY_AREAS)}."
             ),
-            'key_messages': [
-                f"Key message {i+1} regarding agency priorities"
-                for i in range(random.randint(3, 5))
-            ],
-            'questions_for_the_record': random.randint(0, 15),
-            'clearance_status': random.choice(['Pending OMB Review', 'Agency Review', 'Final Clearance']),
-            'prepared_by': {
-                'name': self.fake.name(),
+            key_messages=list(self.KEY_MESSAGES[:self._rng.randint(3, 5)]),
+            questions_for_the_record=self._rng.randint(0, 15),
+            clearance_status=choice(self.CLEARANCE_STATUSES),
+            prepared_by={
+                'name': self.pooled_name(),
                 'title': 'Congressional Affairs Specialist',
             },
-            'confidentiality_notice': (
+            confidentiality_notice=(
                 "This draft testimony is pre-decisional and protected under 5 USC 552(b)(5). "
                 "Do not release until after congressional testimony is delivered."
             ),
-        })
-        return doc
+        )
 
     def _generate_hearing_record(self, subcategory: str) -> Dict[str, Any]:
         """Generate an administrative hearing record."""
+        choice = self._rng.choice
         agency = self.get_agency()
         appellant = self.fake.name()
+        _, city, state, _ = self.pooled_address()
 
-        doc = self._build_base_document('hearing_record', subcategory, is_positive=True)
-        doc.update({
-            'title': 'Administrative Hearing Record',
-            'classification': 'CONTROLLED UNCLASSIFIED INFORMATION - ADMINISTRATIVE PROCEEDINGS',
-            'docket_number': f"{random.randint(2020, 2025)}-{random.randint(1000, 9999)}",
-            'case_type': random.choice([
-                'Adverse Personnel Action Appeal',
-                'Retirement Benefits Dispute',
-                'Performance Rating Appeal',
-                'Discrimination Complaint',
-                'Whistleblower Retaliation',
-            ]),
-            'appellant': {
+        return self._build_base_document(
+            'hearing_record', subcategory, is_positive=True,
+            title='Administrative Hearing Record',
+            classification='CONTROLLED UNCLASSIFIED INFORMATION - ADMINISTRATIVE PROCEEDINGS',
+            docket_number=self._docket_number(),
+            case_type=choice(self.CASE_TYPES),
+            appellant={
                 'name': appellant,
-                'former_position': self.fake.job(),
+                'former_position': self.pooled_job(),
                 'former_agency': agency,
             },
-            'respondent': {
+            respondent={
                 'agency': agency,
-                'representative': self.fake.name(),
+                'representative': self.pooled_name(),
             },
-            'administrative_judge': {
-                'name': self.fake.name(),
+            administrative_judge={
+                'name': self.pooled_name(),
                 'title': 'Administrative Judge',
-                'board': random.choice(['MSPB', 'EEOC', 'FLRA', 'OWCP']),
+                'board': choice(self.ADJUDICATING_BOARDS),
             },
-            'hearing_date': self.generate_date_in_range(-60, -7).strftime('%B %d, %Y'),
-            'hearing_location': f"{self.fake.city()}, {self.fake.state_abbr()}",
-            'issues': [
-                f"Issue {i+1}: {random.choice(['Procedural violation', 'Substantive violation', 'Penalty determination'])}"
-                for i in range(random.randint(2, 5))
+            hearing_date=self.format_date(self.generate_day_in_range(-60, -7)),
+            hearing_location=f"{city}, {state}",
+            issues=[
+                f"Issue {i}: {issue}"
+                for i, issue in enumerate(self._rng.choices(self.HEARING_ISSUES, k=self._rng.randint(2, 5)), 1)
             ],
-            'witnesses_called': random.randint(2, 8),
-            'exhibits_admitted': random.randint(5, 25),
-            'record_status': random.choice(['Open', 'Closed', 'Under Advisement']),
-            'decision_due': self.generate_date_in_range(30, 90).strftime('%B %d, %Y'),
-        })
-        return doc
+            witnesses_called=self._rng.randint(2, 8),
+            exhibits_admitted=self._rng.randint(5, 25),
+            record_status=choice(self.RECORD_STATUSES),
+            decision_due=self.format_date(self.generate_day_in_range(30, 90)),
+        )
 
     def _generate_legal_faq(self) -> Dict[str, Any]:
         """Generate a public legal FAQ (negative example)."""
-        doc = self._build_base_document('legal_faq', 'general', is_positive=False)
-        doc.update({
-            'title': 'Legal FAQ for Federal Employees',
-            'publisher': 'Office of Personnel Management',
-            'publication_date': self.generate_date_in_range(-180, 0).strftime('%B %d, %Y'),
-            'topics': [
+        return self._build_base_document(
+            'legal_faq', 'general', is_positive=False,
+            title='Legal FAQ for Federal Employees',
+            publisher='Office of Personnel Management',
+            publication_date=self.format_date(self.generate_day_in_range(-180, 0)),
+            topics=[
                 'Hatch Act Overview',
                 'Ethics Rules for Federal Employees',
                 'FOIA Request Process',
                 'Whistleblower Protections',
             ],
-            'disclaimer': (
+            disclaimer=(
                 "This FAQ provides general information only and does not constitute legal advice. "
                 "Consult with your agency's Office of General Counsel for specific legal questions."
             ),
-            'distribution': 'Unlimited Public Distribution',        })
-        return doc
+            distribution='Unlimited Public Distribution',
+        )
 
     def _generate_union_rights(self) -> Dict[str, Any]:
         """Generate employee union rights information (negative example)."""
-        doc = self._build_base_document('union_rights', 'collective_bargaining', is_positive=False)
-        doc.update({
-            'title': 'Federal Employee Union Rights',
-            'publisher': 'Federal Labor Relations Authority',
-            'publication_date': self.generate_date_in_range(-365, 0).strftime('%B %d, %Y'),
-            'content': (
+        return self._build_base_document(
+            'union_rights', 'collective_bargaining', is_positive=False,
+            title='Federal Employee Union Rights',
+            publisher='Federal Labor Relations Authority',
+            publication_date=self.format_date(self.generate_day_in_range(-365, 0)),
+            content=(
                 "This document outlines the statutory rights of federal employees to organize "
                 "and participate in labor organizations under 5 USC Chapter 71."
             ),
-            'topics': [
+            topics=[
                 'Right to Organize',
                 'Collective Bargaining Process',
                 'Unfair Labor Practice Complaints',
                 'Representation Rights',
             ],
-            'resources': [
+            resources=[
                 'FLRA Website',
                 'Your Union Representative',
                 'Agency Labor Relations Office',
             ],
-            'distribution': 'Unlimited Public Distribution',        })
-        return doc
+            distribution='Unlimited Public Distribution',
+        )
 
     def _generate_public_testimony(self) -> Dict[str, Any]:
         """Generate published congressional testimony (negative example)."""
-        agency = self.get_agency()
-        doc = self._build_base_document('public_testimony', 'legislative', is_positive=False)
-        doc.update({
-            'title': 'Published Congressional Testimony',
-            'witness': {
-                'name': self.fake.name(),
+        return self._build_base_document(
+            'public_testimony', 'legislative', is_positive=False,
+            title='Published Congressional Testimony',
+            witness={
+                'name': self.pooled_name(),
                 'title': self.get_agency_title('executive'),
-                'agency': agency,
+                'agency': self.get_agency(),
             },
-            'committee': random.choice(self.LEGISLATIVE_BODIES),
-            'hearing_date': self.generate_date_in_range(-90, -7).strftime('%B %d, %Y'),
-            'publication_date': self.generate_date_in_range(-60, 0).strftime('%B %d, %Y'),
-            'topic': 'Agency Oversight Hearing',
-            'status': 'Published in Congressional Record',
-            'transcript_available': True,
-            'distribution': 'Unlimited Public Distribution',        })
-        return doc
+            committee=self._rng.choice(self.LEGISLATIVE_BODIES),
+            hearing_date=self.format_date(self.generate_day_in_range(-90, -7)),
+            publication_date=self.format_date(self.generate_day_in_range(-60, 0)),
+            topic='Agency Oversight Hearing',
+            status='Published in Congressional Record',
+            transcript_available=True,
+            distribution='Unlimited Public Distribution',
+        )
 
     def _generate_appeal_guide(self) -> Dict[str, Any]:
         """Generate an appeal process guide (negative example)."""
-        doc = self._build_base_document('appeal_guide', 'administrative', is_positive=False)
-        doc.update({
-            'title': 'Guide to the Appeals Process',
-            'publisher': 'Merit Systems Protection Board',
-            'publication_date': self.generate_date_in_range(-365, 0).strftime('%B %Y'),
-            'audience': 'Federal Employees and Applicants',
-            'chapters': [
+        return self._build_base_document(
+            'appeal_guide', 'administrative', is_positive=False,
+            title='Guide to the Appeals Process',
+            publisher='Merit Systems Protection Board',
+            publication_date=_format_ordinal(self.generate_day_in_range(-365, 0).toordinal(), '%B %Y'),
+            audience='Federal Employees and Applicants',
+            chapters=[
                 'Understanding Your Appeal Rights',
                 'Filing an Appeal',
                 'The Hearing Process',
                 'Post-Hearing Procedures',
                 'Further Review Options',
             ],
-            'forms_referenced': [
+            forms_referenced=[
                 'MSPB Form 185',
                 'Standard Form 50',
             ],
-            'contact': 'MSPB Regional Offices',
-            'distribution': 'Unlimited Public Distribution',        })
-        return doc
+            contact='MSPB Regional Offices',
+            distribution='Unlimited Public Distribution',
+        )
@@ -1,6 +1,8 @@
 """
 Unit tests for CUI generators
 """
+import json
+import re
 import pytest
 import sys
 import os
@@ -22,6 +24,21 @@ from generators.cui import (
 )
 
 
+class _FakerNameGenerator(BaseCUIGenerator):
+    """Minimal generator whose documents come straight from Faker"""
+
+    CATEGORY = 'test'
+
+    def generate_positive(self):
+        return {'name': self.fake.name(), 'has_cui': True}
+
+    def generate_negative(self):
+        return {'name': self.fake.name(), 'has_cui': False}
+
+    def get_document_types(self):
+        return {}
+
+
 class TestCUIGeneratorFactory:
     """Tests for the CUI generator factory"""
 
@@ -48,6 +65,20 @@ class TestCUIGeneratorFactory:
         gen = CUIGeneratorFactory.get_generator('legal')
         assert isinstance(gen, LegalCUIGenerator)
 
+    def test_package_import_defers_category_modules(self):
+        """Test that importing the package loads category modules only on demand"""
+        import subprocess
+        src = os.path.join(os.path.dirname(__file__), '..', 'src')
+        script = (
+            "import sys\n"
+            "import generators.cui as cui\n"
+            "loaded = lambda: sorted(m for m in sys.modules if m.endswith('_generator'))\n"
+            "assert loaded() == [], loaded()\n"
+            "assert cui.CUIGeneratorFactory.get_generator_class('tax') is cui.TaxCUIGenerator\n"
+            "assert loaded() == ['generators.cui.tax_generator'], loaded()\n"
+        )
+        subprocess.run([sys.executable, '-c', script], cwd=src, check=True)
+
     def test_get_generator_invalid_category_raises(self):
         """Test that invalid category raises KeyError"""
         with pytest.raises(KeyError):
@@ -74,6 +105,21 @@ class TestCUIGeneratorFactory:
         doc = gen.generate_positive()
         assert 'category' in doc
 
+    def test_same_seed_gives_categories_distinct_streams(self):
+        """Test that generators sharing a seed do not share an RNG stream"""
+        financial = FinancialCUIGenerator(seed=42)._rng
+        legal = LegalCUIGenerator(seed=42)._rng
+        assert [financial.random() for _ in range(4)] != [legal.random() for _ in range(4)]
+
+    def test_bulk_draws_ignore_global_random(self):
+        """Test that bulk integer draws and Faker pool picks use the instance RNG"""
+        import random
+        first = LawEnforcementCUIGenerator(seed=5)
+        expected = first._draw_ints(20, 1, 100), first.pooled_name()
+        second = LawEnforcementCUIGenerator(seed=5)
+        random.seed(999)
+        assert (second._draw_ints(20, 1, 100), second.pooled_name()) == expected
+
 
 class TestIndividualGenerators:
     """Tests for individual CUI category generators"""
@@ -169,6 +215,48 @@ class TestFinancialGenerator:
                 assert 'amount' in doc
                 break
 
+    def test_same_seed_reproduces_documents(self):
+        """Test that generators with the same seed produce the same documents"""
+        first = FinancialCUIGenerator(seed=7).generate_positive()
+        second = FinancialCUIGenerator(seed=7).generate_positive()
+        first.pop('generated_date')
+        second.pop('generated_date')
+        assert first == second
+
+    def test_parallel_generate_batch_counts(self):
+        """Test that parallel batch generation returns the requested counts"""
+        docs = FinancialCUIGenerator.generate_batch(6, 3, workers=2, seed=42)
+        assert len(docs) == 9
+        assert [d['has_cui'] for d in docs] == [True] * 6 + [False] * 3
+
+    def test_seeded_batch_independent_of_worker_count(self):
+        """Test that a seeded batch does not depend on the number of workers"""
+        serial = FinancialCUIGenerator.generate_batch(6, 2, workers=1, seed=42, shard_size=3)
+        parallel = FinancialCUIGenerator.generate_batch(6, 2, workers=2, seed=42, shard_size=3)
+        for doc in serial + parallel:
+            doc.pop('generated_date')
+        assert serial == parallel
+
+    def test_unseeded_parallel_shards_differ(self):
+        """Test that unseeded workers do not replay the same Faker stream"""
+        docs = _FakerNameGenerator.generate_batch(8, 0, workers=2, shard_size=4)
+        assert [d['name'] for d in docs[:4]] != [d['name'] for d in docs[4:]]
+
+    def test_generate_to_jsonl_round_trip(self, tmp_path):
+        """Test that the JSONL writer emits one decodable document per line"""
+        path = tmp_path / 'financial.jsonl'
+        written = FinancialCUIGenerator.generate_to_jsonl(str(path), 8, 4, workers=2, seed=42, shard_size=2)
+        lines = path.read_bytes().splitlines()
+        assert written == len(lines) == 12
+        docs = [json.loads(line) for line in lines]
+        assert [d['has_cui'] for d in docs] == [True] * 8 + [False] * 4
+
+    def test_generate_positive_bytes_is_json(self, generator):
+        """Test that the bytes path produces a decodable JSON document"""
+        doc = json.loads(generator.generate_positive_bytes())
+        assert doc['has_cui'] is True
+        assert doc['category'] == 'financial'
+
 
 class TestProcurementGenerator:
     """Specific tests for Procurement CUI generator"""
@@ -185,6 +273,47 @@ class TestProcurementGenerator:
                 assert 'evaluation_factors' in doc or 'solicitation_number' in doc
                 break
 
+    def test_format_currency_cents(self, generator):
+        """Test integer-cent formatting against known amounts"""
+        assert generator.format_currency_cents(0) == '$0.00'
+        assert generator.format_currency_cents(5) == '$0.05'
+        assert generator.format_currency_cents(123456789) == '$1,234,567.89'
+        assert generator.format_currency_cents(123456789) == generator.format_currency(1234567.89)
+
+    def test_igce_cost_elements_follow_shares(self, generator):
+        """Test that IGCE cost elements are their share of the total, to the cent"""
+        def cents(formatted):
+            return int(formatted.lstrip('$').replace(',', '').replace('.', ''))
+
+        for _ in range(20):
+            doc = generator._generate_igce('source_selection')
+            total = cents(doc['total_estimated_cost'])
+            shares = generator.IGCE_COST_SHARES
+            for element, (_, base_percent, option_percent) in zip(doc['cost_elements'], shares):
+                assert abs(cents(element['base_year']) * 100 - total * base_percent) <= 50
+                assert abs(cents(element['options']) * 100 - total * option_percent) <= 50
+            base_sum = sum(cents(e['base_year']) for e in doc['cost_elements'])
+            expected = total * sum(base for _, base, _ in shares) / 100
+            assert abs(base_sum - expected) <= len(shares)
+
+    def test_cage_code_and_solicitation_number_formats(self, generator):
+        """Test CAGE code and solicitation number shapes and ranges"""
+        for _ in range(500):
+            assert re.fullmatch(r'[A-Z0-9]{5}', generator._cage_code())
+            match = re.fullmatch(r'(\d{2})S(\d{3})D(\d{4})', generator._solicitation_number())
+            assert match
+            prefix, middle, serial = map(int, match.groups())
+            assert 10 <= prefix <= 99 and 100 <= middle <= 999 and 1000 <= serial <= 9999
+
+    def test_cage_code_and_solicitation_number_bounds(self, generator, monkeypatch):
+        """Test the smallest and largest draws map to the ends of each range"""
+        monkeypatch.setattr(generator._rng, 'randrange', lambda n: 0)
+        assert generator._cage_code() == 'AAAAA'
+        assert generator._solicitation_number() == '10S100D1000'
+        monkeypatch.setattr(generator._rng, 'randrange', lambda n: n - 1)
+        assert generator._cage_code() == '99999'
+        assert generator._solicitation_number() == '99S999D9999'
+
 
 class TestLegalGenerator:
     """Specific tests for Legal CUI generator"""
@@ -202,6 +331,30 @@ class TestLegalGenerator:
                 assert 'PRIVILEGE' in doc['classification'].upper() or 'ATTORNEY' in doc['classification'].upper()
                 break
 
+    def test_reference_number_formats(self, generator):
+        """Test that memo, proposal and docket numbers stay in their ranges"""
+        for _ in range(200):
+            year, seq = generator._memo_number().split('-')[1:]
+            assert 2024 <= int(year) <= 2025 and 100 <= int(seq) <= 999
+            year, seq = generator._proposal_number().split('-')[1:]
+            assert 2024 <= int(year) <= 2025 and 10 <= int(seq) <= 99
+            year, seq = generator._docket_number().split('-')
+            assert 2020 <= int(year) <= 2025 and 1000 <= int(seq) <= 9999
+            unit, local = generator._union_local().rsplit(' ', 1)
+            assert unit in generator.BARGAINING_UNITS and 100 <= int(local) <= 999
+
+
+class TestCriticalInfrastructureGenerator:
+    """Specific tests for Critical Infrastructure CUI generator"""
+
+    def test_same_seed_reproduces_documents(self):
+        """Test that generators with the same seed produce the same documents"""
+        first = CriticalInfrastructureCUIGenerator(seed=7).generate_positive()
+        second = CriticalInfrastructureCUIGenerator(seed=7).generate_positive()
+        first.pop('generated_date')
+        second.pop('generated_date')
+        assert first == second
+
 
 class TestCompositeCUIGenerator:
     """Tests for the composite CUI generator"""
@@ -240,6 +393,25 @@ class TestCompositeCUIGenerator:
         assert positive_count == 10
         assert negative_count == 5
 
+    def test_generate_batch_iter_is_lazy(self, composite):
+        """Test that the streaming batch yields documents on demand"""
+        stream = composite.generate_batch_iter(positive_count=4, negative_count=2)
+        first = next(stream)
+        assert isinstance(first, dict)
+
+        docs = [first, *stream]
+        assert len(docs) == 6
+        assert sum(1 for d in docs if d.get('has_cui') is True) == 4
+
+    def test_generate_batch_iter_restores_clock_snapshot(self, composite):
+        """Test that a finished stream restores each generator's previous clock snapshot"""
+        from datetime import datetime
+        outer_now = datetime(2025, 1, 1)
+        for generator in composite.generators.values():
+            generator._batch_now = outer_now
+        list(composite.generate_batch_iter(positive_count=3, negative_count=1))
+        assert all(g._batch_now == outer_now for g in composite.generators.values())
+
 
 class TestCUIClassifications:
     """Test CUI classification markings"""